@@ -1,19 +1,33 @@
 from __future__ import annotations
+
 from typing import Any, Dict, List, Union
+
 from langchain_core.messages import BaseMessage
 
 
 def manage_messages(
-        left: List[BaseMessage], right: Union[List[BaseMessage], Dict[str, Any]]
+    left: List[BaseMessage], right: Union[List[BaseMessage], Dict[str, Any]]
 ) -> List[BaseMessage]:
     """A custom reducer for the `messages` state.
     - If `right` is a list, it appends messages (like `add_messages`).
     - If `right` is a dict with a key `"$replace"`, it replaces the entire list.
+    - If `right` is a dict with a key `"$remove"`, it drops the messages with those ids.
     """
     if isinstance(right, dict) and "$replace" in right:
         # Replace the entire state with the provided list
         return right["$replace"]
 
+    if isinstance(right, dict) and "$remove" in right:
+        # Remove messages by id, without the caller sending the remaining list back
+        # Messages written through "$replace" are stored as sent, so some may still be plain dicts
+        ids_to_remove = set(right["$remove"])
+        return [
+            message
+            for message in left
+            if (message.get("id") if isinstance(message, dict) else message.id)
+            not in ids_to_remove
+        ]
+
     # Default behavior: append messages
     if isinstance(left, list) and isinstance(right, list):
         return left + right
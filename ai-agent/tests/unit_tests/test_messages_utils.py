@@ -0,0 +1,46 @@
+from langchain_core.messages import AIMessage, HumanMessage
+
+from agent.core.messages_utils import manage_messages
+
+
+def test_list_is_appended():
+    left = [HumanMessage(content="hi", id="1")]
+    right = [AIMessage(content="hello", id="2")]
+
+    assert manage_messages(left, right) == left + right
+
+
+def test_replace_returns_the_given_list():
+    left = [HumanMessage(content="hi", id="1")]
+    replacement = [{"type": "human", "content": "edited", "id": "1"}]
+
+    assert manage_messages(left, {"$replace": replacement}) == replacement
+
+
+def test_remove_drops_messages_by_id():
+    left = [HumanMessage(content="hi", id="1"), AIMessage(content="hello", id="2")]
+
+    assert manage_messages(left, {"$remove": ["1"]}) == [left[1]]
+
+
+def test_remove_handles_dict_and_message_objects():
+    # State left behind by an earlier "$replace" holds raw dicts next to message objects
+    left = [
+        {"type": "human", "content": "hi", "id": "1"},
+        AIMessage(content="hello", id="2"),
+        {"type": "human", "content": "again", "id": "3"},
+        AIMessage(content="bye", id="4"),
+    ]
+
+    result = manage_messages(left, {"$remove": ["2", "3"]})
+
+    assert result == [left[0], left[3]]
+
+
+def test_remove_with_unknown_id_keeps_everything():
+    left = [
+        {"type": "human", "content": "hi", "id": "1"},
+        AIMessage(content="hello", id="2"),
+    ]
+
+    assert manage_messages(left, {"$remove": ["missing"]}) == left
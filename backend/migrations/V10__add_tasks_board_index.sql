@@ -0,0 +1,4 @@
+-- Partial index for kanban board columns: the (user, notebook, status) filter on
+-- non-archived tasks, already in position order, so column reads need no sort and
+-- column counts can be answered with an index-only scan.
+CREATE INDEX CONCURRENTLY idx_tasks_board ON tasks(user_id, notebook_id, status, position) INCLUDE (id) WHERE archived = false;
@@ -0,0 +1,3 @@
+-- Full-text search on whiteboard titles.
+-- The indexed expression must match the one used by WhiteboardRepository._apply_search.
+CREATE INDEX CONCURRENTLY idx_whiteboards_title_fts ON whiteboards USING GIN (to_tsvector('simple', coalesce(title, '')));
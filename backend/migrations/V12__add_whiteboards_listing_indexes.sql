@@ -0,0 +1,9 @@
+-- Ordered indexes for whiteboard listings (WHERE user_id [AND notebook_id] ORDER BY updated_at DESC, id DESC),
+-- so LIMIT can stop after one page instead of sorting every whiteboard of the user. With id as the
+-- tiebreaker, a keyset page ((updated_at, id) < (:updated_at, :id)) is a single range scan as well.
+CREATE INDEX CONCURRENTLY idx_whiteboards_user_updated_id ON whiteboards(user_id, updated_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY idx_whiteboards_user_notebook_updated_id ON whiteboards(user_id, notebook_id, updated_at DESC, id DESC);
+
+-- Both are prefixes of the indexes above and no longer needed.
+DROP INDEX CONCURRENTLY IF EXISTS idx_whiteboards_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_whiteboards_user_notebook;
@@ -0,0 +1,3 @@
+-- Trigram matching for whiteboard titles (see V14).
+-- Kept on its own: CREATE EXTENSION runs in a transaction, while the index build in V14 cannot.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
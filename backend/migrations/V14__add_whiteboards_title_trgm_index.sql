@@ -0,0 +1,3 @@
+-- Trigram index on whiteboard titles. Serves the substring (ILIKE '%q%') fallback
+-- for short queries and the fuzzy search's title % q similarity match.
+CREATE INDEX CONCURRENTLY idx_whiteboards_title_trgm ON whiteboards USING GIN (title gin_trgm_ops);
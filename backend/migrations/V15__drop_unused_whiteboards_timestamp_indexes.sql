@@ -0,0 +1,5 @@
+-- Every whiteboard query is scoped to a user, and the (user_id, [notebook_id,] updated_at DESC, id DESC)
+-- indexes serve all of them. The standalone timestamp indexes are never chosen, yet
+-- idx_whiteboards_updated_at is rewritten on every content autosave.
+DROP INDEX CONCURRENTLY IF EXISTS idx_whiteboards_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_whiteboards_updated_at;
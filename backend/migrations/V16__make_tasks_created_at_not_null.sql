@@ -0,0 +1,5 @@
+-- The task listings page by (status, position, created_at DESC, id); a NULL
+-- created_at sorts first under DESC and the keyset seek can never reach it.
+-- Backfill the few rows without one and forbid NULLs from now on.
+UPDATE tasks SET created_at = COALESCE(updated_at, now()) WHERE created_at IS NULL;
+ALTER TABLE tasks ALTER COLUMN created_at SET NOT NULL;
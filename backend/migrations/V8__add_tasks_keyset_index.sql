@@ -0,0 +1,3 @@
+-- Composite index backing keyset pagination of a user's tasks.
+-- Matches the ORDER BY status, position, created_at DESC, id used by the task listings.
+CREATE INDEX CONCURRENTLY idx_tasks_user_status_position ON tasks(user_id, status, position, created_at DESC, id);
@@ -0,0 +1,2 @@
+-- GIN index for tag filtering (tags && ARRAY[...]) on the task listings and search.
+CREATE INDEX CONCURRENTLY idx_tasks_tags_gin ON tasks USING GIN (tags);
@@ -1,4 +1,5 @@
 from typing import Optional, List, AsyncGenerator
+from uuid import UUID
 import asyncio
 import json
 
@@ -11,7 +12,7 @@ from backend.models import User
 from backend.api.routes.auth_route import get_current_user
 from backend.models.dtos.chat import ChatResponse, MessageResponse, SendMessageRequest, CreateThreadRequest, \
     UpdateWebSearchRequest
-from backend.services.ai_service import AIService
+from backend.services.ai_service import AIRunsBusyError, AIService
 from backend.services.chat_service import ChatService
 from backend.container import container
 
@@ -74,7 +75,7 @@ async def get_thread_messages(
 
 @router.post("/{thread_id}/send")
 async def send_message_to_thread(
-        thread_id: str,
+        thread_id: UUID,
         request: SendMessageRequest,
         current_user: User = Depends(get_current_user),
         chat_service: ChatService = Depends(get_chat_service)
@@ -129,7 +130,7 @@ async def create_new_thread(
 
 @router.delete("/{chat_id}")
 async def delete_chat(
-        chat_id: str,
+        chat_id: UUID,
         chat_service: ChatService = Depends(get_chat_service)
 ):
     """
@@ -198,7 +199,7 @@ async def sse_endpoint(thread_id: str):
 
 @router.put("/{chat_id}/web-search")
 async def toggle_chat_web_search(
-        chat_id: str,
+        chat_id: UUID,
         request: UpdateWebSearchRequest,
         current_user: User = Depends(get_current_user),
         chat_service: ChatService = Depends(get_chat_service)
@@ -276,6 +277,8 @@ async def generate_whiteboard_content(
         return result
     except HTTPException:
         raise
+    except AIRunsBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         print(f"Error in generate_whiteboard_content: {str(e)}")  # Debug log
         raise HTTPException(status_code=500, detail=f"Error generating whiteboard content: {str(e)}")
\ No newline at end of file
@@ -14,7 +14,7 @@ from backend.models import User, File
 from backend.api.routes.auth_route import get_current_user
 from backend.models.dtos.chat import SendMessageRequest
 from backend.models.file import ProcessingStatus
-from backend.services.ai_service import AIService
+from backend.services.ai_service import AIRunsBusyError, AIService
 from backend.services.file_service import FileService
 
 load_dotenv()
@@ -225,6 +225,8 @@ async def upload_file(
                 "folder_id": folder_id
             }
         }
+    except AIRunsBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -397,6 +399,10 @@ async def transcribe_file_endpoint(
                 content_type=file_record.content_type
             )
         return {"status": "success", "message": "Transcription initiated"}
+    except HTTPException:
+        raise
+    except AIRunsBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
 
@@ -437,6 +443,8 @@ async def rewrite_file_content(
         return {"status": "success", "message": "Content rewriting initiated"}
     except HTTPException:
         raise
+    except AIRunsBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
 
@@ -480,6 +488,8 @@ async def generate_file_tasks(
         return {"status": "success", "message": "Task generation initiated"}
     except HTTPException:
         raise
+    except AIRunsBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
 
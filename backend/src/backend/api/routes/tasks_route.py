@@ -9,6 +9,7 @@ from backend.models import User
 from backend.api.routes.auth_route import get_current_user
 from backend.models.dtos.task_dtos import (
     TaskCreateRequest,
+    TaskImportRequest,
     TaskUpdateRequest,
     TaskMoveRequest,
     TaskReorderRequest,
@@ -22,6 +23,14 @@ from backend.services.task_service import TaskService
 
 router = APIRouter()
 
+# Task listings page with keyset cursors only; silently ignoring an offset would return page 1
+OFFSET_NOT_SUPPORTED = "Offset paging is not supported for tasks; pass the next_cursor of the previous page as cursor"
+
+
+def _reject_offset(offset: Optional[int]) -> None:
+    if offset is not None:
+        raise HTTPException(status_code=400, detail=OFFSET_NOT_SUPPORTED)
+
 
 @router.get("")
 async def get_all_tasks(
@@ -33,12 +42,15 @@ async def get_all_tasks(
     notebook_id: Optional[str] = Query(None, description="Filter by specific notebook"),
     include_archived: bool = Query(False, description="Include archived tasks"),
     limit: int = Query(1000, ge=1, le=2000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip")
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    offset: Optional[int] = Query(None, description="No longer supported; use cursor")
 ):
     """
     Get all tasks for a user across all notebooks with optional filtering.
     """
     try:
+        _reject_offset(offset)
+
         # Parse filters
         from backend.models.task import TaskStatus, TaskPriority
 
@@ -73,7 +85,7 @@ async def get_all_tasks(
             tags=tags_filter,
             notebook_id=notebook_id,
             limit=limit,
-            offset=offset,
+            cursor=cursor,
             include_archived=include_archived
         )
 
@@ -87,10 +99,13 @@ async def get_all_tasks(
         return {
             "tasks": task_responses,
             "total_count": len(task_responses),
+            "next_cursor": task_service.next_page_cursor(tasks[-1] if tasks else None, len(tasks), limit),
             "status": "success",
             "message": f"Retrieved {len(task_responses)} tasks across all notebooks"
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -107,12 +122,15 @@ async def get_tasks(
     tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)"),
     include_archived: bool = Query(False, description="Include archived tasks"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip")
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    offset: Optional[int] = Query(None, description="No longer supported; use cursor")
 ):
     """
     Get all tasks for a user in a specific notebook with optional filtering.
     """
     try:
+        _reject_offset(offset)
+
         # Parse filters
         from backend.models.task import TaskStatus, TaskPriority
 
@@ -147,7 +165,7 @@ async def get_tasks(
             priority=priority_filter,
             tags=tags_filter,
             limit=limit,
-            offset=offset,
+            cursor=cursor,
             include_archived=include_archived
         )
 
@@ -156,9 +174,12 @@ async def get_tasks(
         return TasksListResponse(
             tasks=task_responses,
             total_count=len(task_responses),
+            next_cursor=task_service.next_page_cursor(tasks[-1] if tasks else None, len(tasks), limit),
             message=f"Retrieved {len(task_responses)} tasks"
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -198,6 +219,43 @@ async def create_task(
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
 
 
+@router.post("/{notebook_id}/import")
+async def import_tasks(
+    notebook_id: str,
+    import_data: TaskImportRequest,
+    current_user: User = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service)
+):
+    """
+    Create many tasks in a notebook at once, e.g. when importing a board.
+    """
+    try:
+        task_ids = await task_service.bulk_create_tasks(
+            user_id=str(current_user.user_id),
+            notebook_id=notebook_id,
+            tasks_data=import_data.tasks
+        )
+
+        if task_ids is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Notebook not found or access denied"
+            )
+
+        return {
+            "status": "success",
+            "message": f"Imported {len(task_ids)} tasks",
+            "task_ids": task_ids
+        }
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+
+
 @router.get("/task/{task_id}")
 async def get_task(
     task_id: str,
@@ -489,17 +547,25 @@ async def search_tasks(
     Search tasks with advanced filtering.
     """
     try:
+        _reject_offset(search_data.offset)
+
         tasks = await task_service.search_tasks(
             user_id=str(current_user.user_id),
             search_data=search_data,
             notebook_id=notebook_id
         )
 
-        task_responses = [task_service.task_to_response(task) for task in tasks]
+        # Convert while streaming so only one chunk of ORM objects is alive at a time
+        task_responses = []
+        last_task = None
+        async for task in tasks:
+            task_responses.append(task_service.task_to_response(task))
+            last_task = task
 
         return TasksListResponse(
             tasks=task_responses,
             total_count=len(task_responses),
+            next_cursor=task_service.next_page_cursor(last_task, len(task_responses), search_data.limit),
             message=f"Found {len(task_responses)} tasks matching search criteria"
         )
 
@@ -1,7 +1,6 @@
 from typing import Dict, Any
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
-from langgraph_sdk import get_client
-import os
 from dotenv import load_dotenv
 from pydantic import BaseModel
 import json
@@ -9,9 +8,10 @@ import json
 from backend.api.dependencies import get_file_service, get_chat_service, get_ai_service, get_proposition_service, \
     get_whiteboard_service
 from backend.models.file import ProcessingStatus
-from backend.services.ai_service import AIService
+from backend.services.ai_service import AIRunsBusyError, AIService
 from backend.services.chat_service import ChatService
 from backend.services.file_service import FileService
+from backend.services.langgraph_client import get_langgraph_client
 from fastapi import FastAPI, Request, BackgroundTasks
 from backend.container import container
 from backend.services.proposition_service import PropositionService
@@ -19,7 +19,6 @@ from backend.services.whiteboard_service import WhiteboardService
 
 router = APIRouter()
 load_dotenv()
-LANGGRAPH_URL = os.getenv("LANGGRAPH_URL")
 
 
 @router.post("/transcription-hook")
@@ -34,7 +33,7 @@ async def handle_transcription_webhook(
     """
     # 1. Initialize Redis and Client
     redis_client = container.redis_client()
-    langgraph_client = get_client(url=LANGGRAPH_URL)
+    langgraph_client = get_langgraph_client()
 
     # 2. Parse Payload
     payload = await request.json()
@@ -285,6 +284,8 @@ async def handle_chat_response_webhook(
                 print(f"Published error to Redis channel {channel}")
 
         return {"status": "received"}
+    except AIRunsBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Webhook processing failed: {str(e)}")
 
@@ -507,10 +508,7 @@ async def handle_chat_name_creation(
         if status == "success":
             chat_id = metadata.get("chat_id")
             title = validated_payload.values.get("title", "Chat")
-            chat = await chat_service.get_chat_by_id(chat_id)
-            if chat:
-                chat.title = title
-                await chat_service.update_chat(chat)
+            await chat_service.update_chat_title(UUID(chat_id), title)
 
         return {"status": "received"}
     except Exception as e:
@@ -625,7 +623,7 @@ async def handle_content_rewriter_webhook(
         request: Request,
         background_tasks: BackgroundTasks,
         file_service: FileService = Depends(get_file_service),
-        langgraph_client = Depends(lambda: get_client(url=LANGGRAPH_URL))
+        langgraph_client = Depends(get_langgraph_client)
 ) -> Dict[str, str]:
     """
     Webhook for Content Rewriter Graph.
@@ -731,7 +729,7 @@ async def handle_task_generation_webhook(
         request: Request,
         background_tasks: BackgroundTasks,
         file_service: FileService = Depends(get_file_service),
-        langgraph_client = Depends(lambda: get_client(url=LANGGRAPH_URL))
+        langgraph_client = Depends(get_langgraph_client)
 ) -> Dict[str, str]:
     """
     Webhook for Task Generation Graph.
@@ -31,27 +31,41 @@ async def get_whiteboards(
     current_user: User = Depends(get_current_user),
     whiteboard_service: WhiteboardService = Depends(get_whiteboard_service),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip")
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    include_content: bool = Query(True, description="Include each whiteboard's content; disable for title-only listings")
 ):
     """
     Get all whiteboards for a user in a specific notebook.
     """
     try:
-        whiteboards = await whiteboard_service.get_whiteboards_for_user(
+        whiteboards, total_count = await whiteboard_service.get_whiteboards_page(
             user_id=str(current_user.user_id),
             notebook_id=notebook_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            include_content=include_content
         )
 
-        whiteboard_responses = [whiteboard_service.whiteboard_to_response(whiteboard) for whiteboard in whiteboards]
+        whiteboard_responses = [
+            whiteboard_service.whiteboard_to_response(whiteboard, include_content=include_content)
+            for whiteboard in whiteboards
+        ]
 
         return WhiteboardsListResponse(
             whiteboards=whiteboard_responses,
-            total_count=len(whiteboard_responses),
+            total_count=total_count,
+            # Offset paging is not mixed with cursors: only offset-free pages hand one out
+            next_cursor=(
+                None if offset
+                else whiteboard_service.next_page_cursor(whiteboards[-1] if whiteboards else None, len(whiteboards), limit)
+            ),
             message=f"Retrieved {len(whiteboard_responses)} whiteboards"
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -263,18 +277,33 @@ async def search_whiteboards(
     Search whiteboards with advanced filtering.
     """
     try:
-        whiteboards = await whiteboard_service.search_whiteboards(
+        whiteboards, total_count = await whiteboard_service.get_whiteboards_page(
             user_id=str(current_user.user_id),
-            search_data=search_data,
-            notebook_id=notebook_id
+            notebook_id=notebook_id,
+            query=search_data.query,
+            limit=search_data.limit,
+            offset=search_data.offset,
+            fuzzy=search_data.fuzzy,
+            cursor=search_data.cursor,
+            include_content=search_data.include_content
         )
 
-        whiteboard_responses = [whiteboard_service.whiteboard_to_response(whiteboard) for whiteboard in whiteboards]
+        whiteboard_responses = [
+            whiteboard_service.whiteboard_to_response(whiteboard, include_content=search_data.include_content)
+            for whiteboard in whiteboards
+        ]
 
         return WhiteboardsListResponse(
             whiteboards=whiteboard_responses,
-            total_count=len(whiteboard_responses),
-            message=f"Found {len(whiteboard_responses)} whiteboards matching search criteria"
+            total_count=total_count,
+            next_cursor=(
+                None if search_data.fuzzy or search_data.offset
+                else whiteboard_service.next_page_cursor(whiteboards[-1] if whiteboards else None, len(whiteboards), search_data.limit)
+            ),
+            message=(
+                f"Retrieved {len(whiteboard_responses)} whiteboards" if total_count is None
+                else f"Found {total_count} whiteboards matching search criteria"
+            )
         )
 
     except ValueError as e:
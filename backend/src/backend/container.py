@@ -48,6 +48,11 @@ from botocore.client import Config  # <--- Add this
 
 load_dotenv()
 
+# Connections the shared S3 client keeps open. botocore's default of 10 would
+# make concurrent downloads (e.g. a notebook's text files) discard and reopen
+# connections once more than 10 requests are in flight.
+S3_MAX_POOL_CONNECTIONS = 32
+
 
 def create_s3_client():
     return boto3.client(
@@ -55,7 +60,11 @@ def create_s3_client():
         endpoint_url=os.getenv("S3_ENDPOINT_URL", "http://seaweedfs:8333"),
         aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID", "any"),
         aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY", "any"),
-        config=Config(signature_version='s3v4'),
+        config=Config(
+            signature_version='s3v4',
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+        ),
         region_name='us-east-1'  # SeaweedFS defaults
     )
 
@@ -183,6 +192,7 @@ class Container(containers.DeclarativeContainer):
         model_api_service=model_api_service,
         notebook_model_service=notebook_model_service,
         assistant_service=assistant_service,
+        session_factory=db.provided.get_session_factory.call(),
     )
 
     user_repository = providers.Factory(UserRepository)
@@ -217,6 +227,7 @@ class Container(containers.DeclarativeContainer):
         assistant_service=assistant_service,
         file_service=file_service,
         ai_service=ai_service,
+        session_factory=db.provided.get_session_factory.call(),
     )
 
 
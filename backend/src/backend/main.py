@@ -1,6 +1,7 @@
 import os
 import asyncio
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 # --- 1. Add APScheduler Imports ---
@@ -34,9 +35,14 @@ from backend.api.routes.model_groups_route import router as model_groups_router
 
 # --- Model Imports ---
 from backend.models.app_settings import AppSettings
+from backend.repositories.assistant_repository import AssistantRepository
 
 # --- Import the sync function ---
 from backend.utils.populate_generative_models import sync_models_to_database
+from backend.services.file_service import ensure_bucket
+from backend.services.langgraph_client import close_langgraph_client, drain_stateless_runs
+from backend.services.notebook_touches import NOTEBOOK_TOUCH_FLUSH_INTERVAL_SECONDS, flush_notebook_touches
+from backend.utils.logging_setup import setup_queue_logging, stop_queue_logging
 
 postgres_db = container.db()
 
@@ -46,6 +52,11 @@ MAX_REQUEST_SIZE = 100 * 1024 * 1024  # 100MB
 # --- 2. Initialize Scheduler & Define Task ---
 scheduler = AsyncIOScheduler()
 
+# Threads for blocking work run via run_in_executor (boto3 S3 calls, ffmpeg).
+# The default of min(32, CPUs + 4) is only a handful in small containers, which
+# would cap concurrent S3 downloads below the S3 client's connection pool.
+DEFAULT_EXECUTOR_MAX_WORKERS = 32
+
 
 async def daily_model_update_task():
     """
@@ -95,6 +106,20 @@ async def init_app_settings(db):
         print(f"ERROR:    Startup: Failed to initialize AppSettings: {e}", flush=True)
 
 
+async def init_assistant_cache(db):
+    """
+    Preloads all assistants into the process-level cache keyed by graph_id.
+    """
+    print("INFO:     Startup: Loading assistants...", flush=True)
+    try:
+        session_factory = db.get_session_factory()
+        async with session_factory() as session:
+            count = await AssistantRepository(session).load_all()
+        print(f"INFO:     Startup: Cached {count} assistants.", flush=True)
+    except Exception as e:
+        print(f"ERROR:    Startup: Failed to load assistants: {e}", flush=True)
+
+
 async def file_size_middleware(request: Request, call_next):
     """
     Middleware to check Content-Length header and reject oversized requests.
@@ -124,6 +149,11 @@ async def lifespan(app: FastAPI):
     Handles application startup and shutdown events.
     """
     # --- Startup ---
+    log_listener = setup_queue_logging()
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=DEFAULT_EXECUTOR_MAX_WORKERS)
+    )
+
     print("INFO:     Application startup: Creating database tables...", flush=True)
     try:
         await postgres_db.create_tables()
@@ -134,6 +164,16 @@ async def lifespan(app: FastAPI):
     # --- Initialize App Settings ---
     await init_app_settings(postgres_db)
 
+    # --- Preload Assistants ---
+    await init_assistant_cache(postgres_db)
+
+    # --- Ensure the S3 bucket exists, so uploads don't check it each time ---
+    try:
+        if await asyncio.get_running_loop().run_in_executor(None, ensure_bucket, container.s3_client()):
+            print("INFO:     Application startup: S3 bucket verified.", flush=True)
+    except Exception as e:
+        print(f"ERROR:    Application startup: S3 bucket check failed: {e}", flush=True)
+
     # Initialize Redis client
     try:
         redis_client = container.redis_client()
@@ -151,6 +191,13 @@ async def lifespan(app: FastAPI):
     start_delay = datetime.now() + timedelta(seconds=10)
     scheduler.add_job(daily_model_update_task, 'date', run_date=start_delay)
 
+    # 3. Write coalesced notebook updated_at bumps from chat activity
+    scheduler.add_job(
+        flush_notebook_touches, 'interval',
+        seconds=NOTEBOOK_TOUCH_FLUSH_INTERVAL_SECONDS,
+        args=[postgres_db.get_session_factory()],
+    )
+
     scheduler.start()
     print(f"INFO:     Application startup: Scheduler started. Initial model sync scheduled for {start_delay}.",
           flush=True)
@@ -160,12 +207,17 @@ async def lifespan(app: FastAPI):
     # --- Shutdown ---
     print("INFO:     Application shutdown: Shutting down Scheduler...", flush=True)
     scheduler.shutdown()
+    await flush_notebook_touches(postgres_db.get_session_factory())
 
     print("INFO:     Application shutdown: Closing Redis connection...", flush=True)
     await redis_client.close()
+    await drain_stateless_runs()
+    await close_langgraph_client()
     print("INFO:     Application shutdown: Disposing database engine.", flush=True)
     await postgres_db.engine.dispose()
 
+    stop_queue_logging(log_listener)
+
 
 # 4. ATTACH THE LIFESPAN TO THE APP INSTANCE
 app = FastAPI(title="Accounting Agent API", lifespan=lifespan)
@@ -219,6 +271,15 @@ async def manual_sync_models():
     return {"status": "success", "message": "Model sync triggered"}
 
 
+@app.post("/system/reload-assistants", tags=["System"], include_in_schema=False)
+async def manual_reload_assistants():
+    """
+    Manually reloads the in-memory assistant cache, e.g. after LangGraph redeploys.
+    """
+    await init_assistant_cache(postgres_db)
+    return {"status": "success", "message": "Assistant cache reloaded"}
+
+
 @app.get("/sse/{channel_id}")
 async def sse_endpoint(channel_id: str, request: Request):
     """
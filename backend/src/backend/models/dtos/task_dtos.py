@@ -67,6 +67,11 @@ class TaskCreateRequest(TaskBase):
         return v.strip()
 
 
+class TaskImportRequest(BaseModel):
+    """Schema for importing many tasks into a notebook at once."""
+    tasks: List[TaskCreateRequest] = Field(..., min_length=1, max_length=1000, description="Tasks to create, in order")
+
+
 class TaskUpdateRequest(TaskBase):
     """
     Schema for the request body when updating a task.
@@ -117,6 +122,7 @@ class TasksListResponse(BaseModel):
     """Schema for response when listing tasks."""
     tasks: List[TaskResponse]
     total_count: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
     status: str = Field("success", description="Response status")
     message: str = Field(default="Tasks retrieved successfully", description="Response message")
 
@@ -137,4 +143,5 @@ class TaskSearchRequest(BaseModel):
     has_due_date: Optional[bool] = Field(None, description="Filter by due date presence")
     is_overdue: Optional[bool] = Field(None, description="Filter by overdue status")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
-    offset: int = Field(0, ge=0, description="Number of results to skip")
+    cursor: Optional[str] = Field(None, description="Cursor returned with the previous page")
+    offset: Optional[int] = Field(None, description="No longer supported; rejected in favour of cursor")
@@ -66,7 +66,8 @@ class WhiteboardResponse(WhiteboardBase):
 class WhiteboardsListResponse(BaseModel):
     """Schema for response when listing whiteboards."""
     whiteboards: list[WhiteboardResponse]
-    total_count: int
+    total_count: Optional[int] = Field(None, description="Total number of matches; only set on the first page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
     status: str = Field("success", description="Response status")
     message: str = Field(default="Whiteboards retrieved successfully", description="Response message")
 
@@ -83,6 +84,9 @@ class WhiteboardSearchRequest(BaseModel):
     query: Optional[str] = Field(None, description="Search query for whiteboard titles")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
     offset: int = Field(0, ge=0, description="Number of results to skip")
+    fuzzy: bool = Field(False, description="Match titles by trigram similarity, tolerating typos")
+    cursor: Optional[str] = Field(None, description="Cursor returned with the previous page")
+    include_content: bool = Field(True, description="Include each whiteboard's content; disable for title-only listings")
 
 
 # Hierarchy management DTOs
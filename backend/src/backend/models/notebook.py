@@ -51,6 +51,16 @@ class Notebook(Base):
     # One-to-one relationship to the default model for this notebook
     default_model = relationship("NotebookModel", back_populates="notebook", uselist=False, cascade="all, delete-orphan")
 
+    # Threads of the notebook's chats. chat.notebook_id has no foreign key, so the
+    # join is spelled out; read-only, chats are managed through ChatRepository.
+    threads = relationship(
+        "Thread",
+        secondary="chat",
+        primaryjoin="Notebook.id == foreign(Chat.notebook_id)",
+        secondaryjoin="foreign(Chat.thread_id) == Thread.thread_id",
+        viewonly=True,
+    )
+
     def __repr__(self):
         """Provides a developer-friendly representation of the object."""
         return f"<Notebook(id={self.id}, title='{self.title}', emoji='{self.emoji}', bg_color='{self.bg_color}')>"
\ No newline at end of file
@@ -1,6 +1,9 @@
 import uuid
+from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 from datetime import date, datetime
+from typing import List, Optional
 
 from sqlalchemy import (
     Column,
@@ -18,6 +21,9 @@ from sqlalchemy.orm import relationship
 
 from backend.databases.postgres_db import Base
 
+# Shared immutable placeholder for tasks without tags (avoids a new list per row)
+EMPTY_TAGS: tuple = ()
+
 
 class TaskStatus(str, Enum):
     TODO = "todo"
@@ -32,7 +38,41 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
-class Task(Base):
+class TaskDisplayMixin:
+    """
+    Derived display fields shared by the Task entity and its lightweight list rows.
+    """
+
+    @property
+    def status_display(self) -> str:
+        """Return user-friendly status display name"""
+        status_map = {
+            TaskStatus.TODO: "To Do",
+            TaskStatus.IN_PROGRESS: "In Progress",
+            TaskStatus.REVIEW: "Review",
+            TaskStatus.DONE: "Done"
+        }
+        return status_map.get(self.status, self.status)
+
+    @property
+    def priority_display(self) -> str:
+        """Return user-friendly priority display name"""
+        priority_map = {
+            TaskPriority.LOW: "Low",
+            TaskPriority.MEDIUM: "Medium",
+            TaskPriority.HIGH: "High"
+        }
+        return priority_map.get(self.priority, self.priority)
+
+    @property
+    def is_overdue(self) -> bool:
+        """Check if task is overdue based on due date"""
+        if not self.due_date:
+            return False
+        return self.due_date.date() < datetime.now().date()
+
+
+class Task(Base, TaskDisplayMixin):
     __tablename__ = 'tasks'
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -60,7 +100,7 @@ class Task(Base):
     archived = Column(Boolean, nullable=False, default=False)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
@@ -69,51 +109,52 @@ class Task(Base):
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
 
-    @property
-    def status_display(self) -> str:
-        """Return user-friendly status display name"""
-        status_map = {
-            TaskStatus.TODO: "To Do",
-            TaskStatus.IN_PROGRESS: "In Progress",
-            TaskStatus.REVIEW: "Review",
-            TaskStatus.DONE: "Done"
-        }
-        return status_map.get(self.status, self.status)
-
-    @property
-    def priority_display(self) -> str:
-        """Return user-friendly priority display name"""
-        priority_map = {
-            TaskPriority.LOW: "Low",
-            TaskPriority.MEDIUM: "Medium",
-            TaskPriority.HIGH: "High"
-        }
-        return priority_map.get(self.priority, self.priority)
-
-    @property
-    def is_overdue(self) -> bool:
-        """Check if task is overdue based on due date"""
-        if not self.due_date:
-            return False
-        return self.due_date.date() < datetime.now().date()
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the primary key, computed once per instance"""
+        return str(self.id)
 
     def to_dict(self) -> dict:
         """Convert task to dictionary for JSON serialization"""
+        due_date = self.due_date
+        created_at = self.created_at
+        updated_at = self.updated_at
         return {
-            'id': str(self.id),
+            'id': self.id_str if self.id is not None else None,
             'user_id': self.user_id,
             'notebook_id': str(self.notebook_id),
             'title': self.title,
             'description': self.description,
             'status': self.status,
             'priority': self.priority,
-            'tags': self.tags or [],
-            'due_date': self.due_date.isoformat() if self.due_date else None,
+            'tags': self.tags if self.tags is not None else EMPTY_TAGS,
+            'due_date': due_date.isoformat() if due_date else None,
             'position': self.position,
             'archived': self.archived,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None,
             'status_display': self.status_display,
             'priority_display': self.priority_display,
             'is_overdue': self.is_overdue
-        }
\ No newline at end of file
+        }
+
+
+@dataclass(frozen=True)
+class TaskListRow(TaskDisplayMixin):
+    """
+    Plain row for task list endpoints, hydrated from a column select
+    without ORM identity tracking.
+    """
+    id: uuid.UUID
+    user_id: str
+    notebook_id: uuid.UUID
+    title: str
+    description: Optional[str]
+    status: str
+    priority: str
+    tags: Optional[List[str]]
+    due_date: Optional[datetime]
+    position: int
+    archived: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
@@ -1,4 +1,5 @@
 import uuid
+from functools import cached_property
 from datetime import datetime
 
 from sqlalchemy import (
@@ -37,10 +38,15 @@ class Whiteboard(Base):
     def __repr__(self):
         return f"<Whiteboard(id={self.id}, title='{self.title}', user_id='{self.user_id}')>"
 
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the primary key, computed once per instance"""
+        return str(self.id)
+
     def to_dict(self) -> dict:
         """Convert whiteboard to dictionary for JSON serialization"""
         return {
-            'id': str(self.id),
+            'id': self.id_str if self.id is not None else None,
             'user_id': self.user_id,
             'notebook_id': str(self.notebook_id),
             'title': self.title,
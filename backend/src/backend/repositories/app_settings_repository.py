@@ -15,7 +15,6 @@ class AppSettingsRepository:
         """Creates a new AppSettings object and adds it to the session."""
         app_setting = AppSettings(key=key, value=value)
         self.session.add(app_setting)
-        await self.session.flush()
         return app_setting
 
     async def get_by_key(self, key: str) -> Optional[AppSettings]:
@@ -38,7 +37,6 @@ class AppSettingsRepository:
         setting = await self.get_by_key(key)
         if setting:
             setting.value = value
-            await self.session.flush()
         return setting
 
     async def update_or_create(self, key: str, value: str) -> AppSettings:
@@ -48,7 +46,6 @@ class AppSettingsRepository:
             setting.value = value
         else:
             setting = await self.create(key, value)
-        await self.session.flush()
         return setting
 
     async def delete_by_key(self, key: str) -> bool:
@@ -56,7 +53,6 @@ class AppSettingsRepository:
         setting = await self.get_by_key(key)
         if setting:
             await self.session.delete(setting)
-            await self.session.flush()
             return True
         return False
 
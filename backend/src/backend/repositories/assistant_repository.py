@@ -1,17 +1,105 @@
-from typing import Optional
+import time
+from typing import Dict, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.assistant import Assistant
 
+# Seconds an assistant is served from the process-level cache before it is read
+# from the database again. Every worker keeps its own cache, so this bounds how
+# long a worker can keep using an assistant that LangGraph has re-registered.
+ASSISTANT_CACHE_TTL = 300
+
+# Process-level cache of assistants keyed by graph_id. Assistants are registered
+# by LangGraph and change rarely, so they are loaded once at startup and served
+# from memory for up to ASSISTANT_CACHE_TTL. Only the repository mutates it.
+_assistants_by_graph_id: Dict[str, Assistant] = {}
+
+# The same cache as assistant_id strings, which is all the request path needs
+# to start a LangGraph run.
+_assistant_ids_by_graph_id: Dict[str, str] = {}
+
+# time.monotonic() at which each graph_id was cached
+_cached_at: Dict[str, float] = {}
+
+
+def _cache_assistant(assistant: Assistant) -> None:
+    _assistants_by_graph_id[assistant.graph_id] = assistant
+    _assistant_ids_by_graph_id[assistant.graph_id] = str(assistant.assistant_id)
+    _cached_at[assistant.graph_id] = time.monotonic()
+
+
+def evict_cached_assistant(graph_id: Optional[str] = None) -> None:
+    """Drops one graph_id (or every assistant) from the process-level cache."""
+    if graph_id is None:
+        _assistants_by_graph_id.clear()
+        _assistant_ids_by_graph_id.clear()
+        _cached_at.clear()
+    else:
+        _assistants_by_graph_id.pop(graph_id, None)
+        _assistant_ids_by_graph_id.pop(graph_id, None)
+        _cached_at.pop(graph_id, None)
+
+
+def _is_fresh(graph_id: str) -> bool:
+    """
+    Whether graph_id is cached and younger than ASSISTANT_CACHE_TTL.
+    An expired entry is evicted, so the next lookup reads the database.
+    """
+    cached_at = _cached_at.get(graph_id)
+    if cached_at is None:
+        return False
+    if time.monotonic() - cached_at >= ASSISTANT_CACHE_TTL:
+        evict_cached_assistant(graph_id)
+        return False
+    return True
+
+
+def get_cached_assistant(graph_id: str) -> Optional[Assistant]:
+    """Returns the cached assistant of graph_id, or None if absent or expired."""
+    return _assistants_by_graph_id.get(graph_id) if _is_fresh(graph_id) else None
+
+
+def get_cached_assistant_id(graph_id: str) -> Optional[str]:
+    """Returns the cached assistant_id of graph_id, or None if absent or expired."""
+    return _assistant_ids_by_graph_id.get(graph_id) if _is_fresh(graph_id) else None
+
 
 class AssistantRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def load_all(self) -> int:
+        """
+        (Re)loads every assistant into the process-level cache.
+        Returns the number of cached assistants.
+        """
+        result = await self.session.execute(select(Assistant))
+        assistants = result.scalars().all()
+        for assistant in assistants:
+            self.session.expunge(assistant)
+
+        evict_cached_assistant()
+        for assistant in assistants:
+            _cache_assistant(assistant)
+        return len(_assistants_by_graph_id)
+
     async def get_by_graph_id(self, graph_id: str) -> Optional[Assistant]:
-        """Gets an assistant by its graph_id."""
+        """
+        Gets an assistant by its graph_id.
+        Served from the process-level cache; falls back to the database on a miss
+        or an expired entry, so assistants registered or re-registered after
+        startup are still found.
+        """
+        assistant = get_cached_assistant(graph_id)
+        if assistant is not None:
+            return assistant
+
         stmt = select(Assistant).where(Assistant.graph_id == graph_id)
         result = await self.session.execute(stmt)
-        return result.scalars().first()
\ No newline at end of file
+        assistant = result.scalars().first()
+        if assistant is not None:
+            self.session.expunge(assistant)
+            _cache_assistant(assistant)
+        return assistant
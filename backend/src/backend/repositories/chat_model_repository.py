@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,9 +22,18 @@ class ChatModelRepository:
             generative_model_id=generative_model_id
         )
         self.session.add(chat_model)
-        await self.session.flush()
         return chat_model
 
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[ChatModel]:
+        """
+        Inserts several chat models with a single INSERT ... VALUES (...), (...)
+        RETURNING statement. Each row needs user_id, chat_id and generative_model_id.
+        """
+        if not rows:
+            return []
+        result = await self.session.scalars(insert(ChatModel).returning(ChatModel), rows)
+        return list(result.all())
+
     async def get_by_id(self, chat_model_id: str) -> Optional[ChatModel]:
         """Retrieves a chat model by its ID."""
         stmt = select(ChatModel).options(
@@ -76,7 +85,6 @@ class ChatModelRepository:
             for key, value in update_data.items():
                 if hasattr(chat_model, key) and value is not None:
                     setattr(chat_model, key, value)
-            await self.session.flush()
         return chat_model
 
     async def delete_by_id(self, chat_model_id: str) -> bool:
@@ -84,7 +92,6 @@ class ChatModelRepository:
         chat_model = await self.get_by_id(chat_model_id)
         if chat_model:
             await self.session.delete(chat_model)
-            await self.session.flush()
             return True
         return False
 
@@ -93,6 +100,5 @@ class ChatModelRepository:
         chat_model = await self.get_by_chat_id(chat_id)
         if chat_model:
             await self.session.delete(chat_model)
-            await self.session.flush()
             return True
         return False
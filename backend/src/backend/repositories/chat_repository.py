@@ -1,42 +1,79 @@
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager
 
 from backend.models.chat import Chat
 from backend.models.chat_model import ChatModel
+from backend.models.generative_model import GenerativeModel
+
+
+@dataclass(frozen=True)
+class ChatSendContext:
+    """The parts of a chat that sending a message to its graph needs."""
+    notebook_id: Optional[uuid.UUID]
+    web_search: bool
+    # Generative model name by model type ("light", "heavy")
+    models: Dict[str, str]
 
 
 class ChatRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_thread_id(self, thread_id: str) -> Optional[Chat]:
-        """Gets a specific chat by its associated thread_id."""
-        try:
-            thread_uuid = uuid.UUID(thread_id)
-        except ValueError:
-            return None
-        stmt = select(Chat).options(
-            selectinload(Chat.models).selectinload(ChatModel.model)
-        ).where(Chat.thread_id == thread_uuid)
+    @staticmethod
+    def _select_with_models():
+        """
+        Selects a chat together with its models and their generative models
+        in a single LEFT OUTER JOIN, instead of one query per relationship.
+        """
+        return (
+            select(Chat)
+            .outerjoin(Chat.models)
+            .outerjoin(ChatModel.model)
+            .options(contains_eager(Chat.models).contains_eager(ChatModel.model))
+        )
+
+    async def get_by_thread_id(self, thread_id: uuid.UUID) -> Optional[Chat]:
+        """
+        Gets a specific chat by its associated thread_id.
+        The id is expected to be validated at the API boundary.
+        Runs on every chat message, so the statement is a cached lambda
+        statement: built and compiled once, later calls only bind thread_id.
+        """
+        stmt = lambda_stmt(lambda: ChatRepository._select_with_models().where(Chat.thread_id == thread_id))
         result = await self.session.execute(stmt)
-        return result.scalars().first()
+        return result.unique().scalars().first()
 
-    async def get_by_id(self, chat_id: str) -> Optional[Chat]:
-        """Gets a specific chat by its chat_id."""
-        try:
-            chat_uuid = uuid.UUID(chat_id)
-        except ValueError:
+    async def get_send_context_by_thread_id(self, thread_id: uuid.UUID) -> Optional[ChatSendContext]:
+        """
+        Gets what sending a message needs, by thread_id, as plain column values:
+        one row per chat model, without hydrating Chat or ChatModel entities.
+        """
+        stmt = lambda_stmt(lambda: (
+            select(Chat.notebook_id, Chat.web_search, GenerativeModel.type, GenerativeModel.name)
+            .outerjoin(ChatModel, ChatModel.chat_id == Chat.chat_id)
+            .outerjoin(GenerativeModel, GenerativeModel.id == ChatModel.generative_model_id)
+            .where(Chat.thread_id == thread_id)
+        ))
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
             return None
-        stmt = select(Chat).options(
-            selectinload(Chat.models).selectinload(ChatModel.model)
-        ).where(Chat.chat_id == chat_uuid)
+        return ChatSendContext(
+            notebook_id=rows[0].notebook_id,
+            web_search=rows[0].web_search,
+            models={row.type: row.name for row in rows if row.type is not None},
+        )
+
+    async def get_by_id(self, chat_id: uuid.UUID) -> Optional[Chat]:
+        """Gets a specific chat by its chat_id."""
+        stmt = self._select_with_models().where(Chat.chat_id == chat_id)
         result = await self.session.execute(stmt)
-        return result.scalars().first()
+        return result.unique().scalars().first()
 
     async def list_by_user_id(self, user_id: str, notebook_id: Optional[str] = None) -> List[Chat]:
         """Gets all chats for a user, optionally filtered by notebook."""
@@ -56,9 +93,11 @@ class ChatRepository:
     ) -> Chat:
         """
         Creates a new Chat object and adds it to the session.
+        The primary key is assigned up front, so it is usable before the flush.
         Note: This method does NOT commit.
         """
         new_chat = Chat(
+            chat_id=uuid.uuid4(),
             user_id=user_id,
             thread_id=uuid.UUID(thread_id),
             notebook_id=notebook_id,
@@ -68,7 +107,6 @@ class ChatRepository:
             web_search=web_search
         )
         self.session.add(new_chat)
-        await self.session.flush()
         return new_chat
 
     async def update(self, chat: Chat) -> Chat:
@@ -77,22 +115,37 @@ class ChatRepository:
         Note: This method does NOT commit. The updated_at timestamp is automatically handled by SQLAlchemy.
         """
         self.session.add(chat)
-        await self.session.flush()
         return chat
 
-    async def delete_by_id(self, chat_id: str) -> bool:
+    async def update_by_id(self, chat_id: uuid.UUID, update_data: Dict[str, Any]) -> Optional[Chat]:
         """
-        Deletes a chat by its ID. Returns True on success.
-        Note: This method does NOT commit.
+        Updates the given columns of a chat with UPDATE ... RETURNING, so the
+        updated row (server-side updated_at included) comes back with the write.
+        Returns None if the chat does not exist. Note: This method does NOT commit.
         """
-        try:
-            chat_uuid = uuid.UUID(chat_id)
-        except ValueError:
-            return False
+        values = {key: value for key, value in update_data.items() if key in Chat.__table__.c}
+        stmt = (
+            update(Chat)
+            .where(Chat.chat_id == chat_id)
+            .values(**values)
+            .returning(Chat)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
 
-        chat = await self.session.get(Chat, chat_uuid)
-        if chat:
-            await self.session.delete(chat)
-            await self.session.flush()
-            return True
-        return False
+    async def delete_by_id(self, chat_id: uuid.UUID) -> bool:
+        """
+        Deletes a chat by its ID with a single DELETE ... RETURNING, without
+        loading it first; its chat models go with it through ON DELETE CASCADE.
+        Returns True on success.
+        Note: This method does NOT commit.
+        """
+        stmt = (
+            delete(Chat)
+            .where(Chat.chat_id == chat_id)
+            .returning(Chat.chat_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
@@ -42,7 +42,6 @@ class FileRepository:
             folder_id=folder_id
         )
         self.session.add(file_record)
-        await self.session.flush()  # Send data to DB to get defaults/IDs
         return file_record
 
     async def list_by_user_id(self, user_id: str, notebook_id: Optional[str] = None) -> List[File]:
@@ -71,7 +70,7 @@ class FileRepository:
             self,
             file_id: str,
             updates: Dict[str, Any],
-            merge_processing_result: bool = False,
+            merge_processing_result: bool = False
     ) -> Optional[File]:
         """
         Update a file record with the provided updates dictionary.
@@ -100,7 +99,6 @@ class FileRepository:
                 # Direct assignment for other fields
                 setattr(existing_file, key, value)
 
-        await self.session.flush()  # Flush to update the object
         return existing_file
 
     async def delete(self, file_id: str) -> bool:
@@ -15,7 +15,6 @@ class FolderRepository:
             parent_id=parent_id
         )
         self.session.add(folder)
-        await self.session.flush()
         return folder
 
     async def list_by_notebook(self, user_id: str, notebook_id: str) -> List[Folder]:
@@ -19,7 +19,6 @@ class GenerativeModelRepository:
             type=type
         )
         self.session.add(generative_model)
-        await self.session.flush()
         return generative_model
 
     async def get_by_id(self, model_id: str) -> Optional[GenerativeModel]:
@@ -60,7 +59,6 @@ class GenerativeModelRepository:
             for key, value in update_data.items():
                 if hasattr(model, key) and value is not None:
                     setattr(model, key, value)
-            await self.session.flush()
         return model
 
     async def delete_by_id(self, model_id: str) -> bool:
@@ -68,7 +66,6 @@ class GenerativeModelRepository:
         model = await self.get_by_id(model_id)
         if model:
             await self.session.delete(model)
-            await self.session.flush()
             return True
         return False
 
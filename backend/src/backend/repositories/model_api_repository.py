@@ -1,7 +1,7 @@
 # backend/repositories/model_api_repository.py
 
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.models.model_api import ModelApi
 
@@ -16,8 +16,11 @@ class ModelApiRepository:
         self.session = session
 
     async def get_by_user_id(self, user_id: str) -> Optional[ModelApi]:
-        """Retrieves a ModelApi record for a specific user."""
-        stmt = select(ModelApi).where(ModelApi.user_id == user_id)
+        """
+        Retrieves a ModelApi record for a specific user.
+        A cached lambda statement, so it is only built and compiled once.
+        """
+        stmt = lambda_stmt(lambda: select(ModelApi).where(ModelApi.user_id == user_id))
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
@@ -39,7 +42,6 @@ class ModelApiRepository:
             )
             self.session.add(model_api)
 
-        await self.session.flush()
         return model_api
 
     async def delete_by_user_id(self, user_id: str) -> bool:
@@ -51,7 +53,6 @@ class ModelApiRepository:
 
         if model_api:
             await self.session.delete(model_api)
-            await self.session.flush()
             return True
 
         return False
\ No newline at end of file
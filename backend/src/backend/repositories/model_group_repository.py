@@ -1,12 +1,30 @@
+import logging
 from typing import List, Optional
-from sqlalchemy import select, delete, update
+from sqlalchemy import select, delete, update, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 import uuid
 
 from backend.models.model_group import ModelGroup
 from backend.models.generative_model import GenerativeModel
 
+logger = logging.getLogger(__name__)
+
+# Binds all ids as a single uuid[] parameter, so the statement is the same
+# (and stays prepared) regardless of how many ids are looked up.
+_MODELS_BY_IDS = select(GenerativeModel).where(
+    GenerativeModel.id == any_(bindparam("ids", type_=ARRAY(UUID(as_uuid=True))))
+)
+
+
+def _to_uuid(value: str) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        logger.warning("Invalid UUID passed to get_models_by_ids: %s", value)
+        return None
+
 
 class ModelGroupRepository:
     def __init__(self, session: AsyncSession):
@@ -25,14 +43,13 @@ class ModelGroupRepository:
             models=models 
         )
         self.session.add(group)
-        await self.session.flush()
         return group
 
     async def get_by_id(self, group_id: str, user_id: str) -> Optional[ModelGroup]:
         stmt = select(ModelGroup).where(
             ModelGroup.id == group_id,
             ModelGroup.user_id == user_id
-        ).options(selectinload(ModelGroup.models))
+        ).options(selectinload(ModelGroup.models), raiseload("*"))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -45,7 +62,6 @@ class ModelGroupRepository:
 
     async def update(self, group: ModelGroup) -> ModelGroup:
         self.session.add(group)
-        await self.session.flush()
         return group
 
     async def delete(self, group_id: str, user_id: str) -> bool:
@@ -60,17 +76,9 @@ class ModelGroupRepository:
         if not model_ids:
             return []
         
-        valid_uuids = []
-        for mid in model_ids:
-            try:
-                valid_uuids.append(uuid.UUID(mid))
-            except ValueError:
-                print(f"Warning: Invalid UUID passed to get_models_by_ids: {mid}")
-                continue
-
+        valid_uuids = [u for u in map(_to_uuid, model_ids) if u is not None]
         if not valid_uuids:
             return []
 
-        stmt = select(GenerativeModel).where(GenerativeModel.id.in_(valid_uuids))
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
\ No newline at end of file
+        result = await self.session.execute(_MODELS_BY_IDS, {"ids": valid_uuids})
+        return result.scalars().all()
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload, raiseload
 
 from backend.models.generative_model import GenerativeModel
 from backend.models.notebook_model import NotebookModel
@@ -22,37 +22,59 @@ class NotebookModelRepository:
             generative_model_id=generative_model_id
         )
         self.session.add(notebook_model)
-        await self.session.flush()
         return notebook_model
 
     async def get_by_id(self, notebook_model_id: str) -> Optional[NotebookModel]:
         """Retrieves a notebook model by its ID."""
         stmt = select(NotebookModel).options(
-            selectinload(NotebookModel.model)
+            selectinload(NotebookModel.model), raiseload("*")
         ).where(NotebookModel.id == notebook_model_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_by_notebook_id_and_type(self, notebook_id: str, model_type: str) -> Optional[NotebookModel]:
-        """Retrieves a notebook model by notebook_id and model type."""
-        stmt = (
+        """
+        Retrieves a notebook model by notebook_id and model type.
+        A cached lambda statement, so it is only built and compiled once.
+        """
+        stmt = lambda_stmt(lambda: (
             select(NotebookModel)
-            .options(selectinload(NotebookModel.model))
-            .join(NotebookModel.model)
+            .options(selectinload(NotebookModel.model), raiseload("*"))
             .where(NotebookModel.notebook_id == notebook_id)
-            .where(GenerativeModel.type == model_type)  # Direct reference to the joined table
-        )
+            # Filter by type through a subquery rather than joining the table selectinload already fetches
+            .where(NotebookModel.generative_model_id.in_(
+                select(GenerativeModel.id).where(GenerativeModel.type == model_type)
+            ))
+        ))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_by_notebook_id(self, notebook_id: str) -> List[NotebookModel]:
-        """Retrieves all notebook models for a specific notebook."""
+    async def get_by_notebook_id_and_types(self, notebook_id: str, model_types: List[str]) -> Dict[str, NotebookModel]:
+        """
+        Retrieves the notebook's models of several types in one query, keyed by type.
+        The generative model is joined in the same SELECT, as its type is the key.
+        """
         stmt = (
             select(NotebookModel)
+            .join(NotebookModel.model)
+            .options(contains_eager(NotebookModel.model), raiseload("*"))
             .where(NotebookModel.notebook_id == notebook_id)
-            .options(selectinload(NotebookModel.model))  # Eagerly load the relationship
+            .where(GenerativeModel.type.in_(model_types))
         )
         result = await self.session.execute(stmt)
+        return {notebook_model.model.type: notebook_model for notebook_model in result.scalars()}
+
+    async def list_by_notebook_id(self, notebook_id: str, include_model: bool = False) -> List[NotebookModel]:
+        """
+        Retrieves all notebook models for a specific notebook.
+        The generative model is only loaded (one extra SELECT) when include_model is set.
+        """
+        stmt = select(NotebookModel).where(NotebookModel.notebook_id == notebook_id)
+        if include_model:
+            stmt = stmt.options(selectinload(NotebookModel.model), raiseload("*"))
+        else:
+            stmt = stmt.options(raiseload("*"))
+        result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_user_id(self, user_id: str) -> List[NotebookModel]:
@@ -62,20 +84,31 @@ class NotebookModelRepository:
         return result.scalars().all()
 
     async def update(self, notebook_model_id: str, update_data: Dict[str, Any]) -> Optional[NotebookModel]:
-        """Updates a notebook model record with the provided data."""
-        notebook_model = await self.get_by_id(notebook_model_id)
-        if notebook_model:
-            for key, value in update_data.items():
-                if hasattr(notebook_model, key) and value is not None:
-                    setattr(notebook_model, key, value)
-            await self.session.flush()
-        return notebook_model
+        """Updates a notebook model record with the provided data using UPDATE ... RETURNING."""
+        values = {
+            key: value for key, value in update_data.items()
+            if key in NotebookModel.__table__.c and value is not None
+        }
+        if not values:
+            return await self.get_by_id(notebook_model_id)
+
+        stmt = (
+            update(NotebookModel)
+            .where(NotebookModel.id == notebook_model_id)
+            .values(**values)
+            .returning(NotebookModel)
+            .options(selectinload(NotebookModel.model), raiseload("*"))
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
 
     async def delete_by_id(self, notebook_model_id: str) -> bool:
-        """Deletes a notebook model by its ID."""
-        notebook_model = await self.get_by_id(notebook_model_id)
-        if notebook_model:
-            await self.session.delete(notebook_model)
-            await self.session.flush()
-            return True
-        return False
+        """Deletes a notebook model by its ID with a single DELETE ... RETURNING."""
+        stmt = (
+            delete(NotebookModel)
+            .where(NotebookModel.id == notebook_model_id)
+            .returning(NotebookModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
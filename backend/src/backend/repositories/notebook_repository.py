@@ -1,14 +1,22 @@
 # backend/repositories/notebook_repository.py
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+import uuid
+from typing import Iterable, List, Optional, Dict, Any
+from sqlalchemy import select, update, delete, bindparam, func
+from sqlalchemy.orm import raiseload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.models.notebook import Notebook
 from backend.models.thread import Thread
 from backend.models.chat import Chat
 from backend.models.file import File
 
+# Listing statements are built once at import time and reused per call.
+_ALL_NOTEBOOKS = select(Notebook).order_by(Notebook.created_at.desc())
+_NOTEBOOKS_BY_USER = (
+    select(Notebook)
+    .where(Notebook.user_id == bindparam("user_id"))
+    .order_by(Notebook.created_at.desc())
+)
 
 class NotebookRepository:
     """
@@ -25,7 +33,6 @@ class NotebookRepository:
             bg_color=bg_color, text_color=text_color
         )
         self.session.add(notebook)
-        await self.session.flush()
         return notebook
 
     async def get_by_id(self, notebook_id: str) -> Optional[Notebook]:
@@ -34,55 +41,80 @@ class NotebookRepository:
 
     async def list_all(self) -> List[Notebook]:
         """Retrieves all notebooks, ordered by most recent."""
-        stmt = select(Notebook).order_by(Notebook.created_at.desc())
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_ALL_NOTEBOOKS)
         return result.scalars().all()
 
     async def list_by_user_id(self, user_id: str) -> List[Notebook]:
         """Retrieves all notebooks for a specific user."""
-        stmt = select(Notebook).where(Notebook.user_id == user_id).order_by(Notebook.created_at.desc())
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_NOTEBOOKS_BY_USER, {"user_id": user_id})
         return result.scalars().all()
 
     async def update(self, notebook_id: str, update_data: Dict[str, Any]) -> Optional[Notebook]:
-        """Updates a notebook record with the provided data."""
-        notebook = await self.get_by_id(notebook_id)
-        if notebook:
-            for key, value in update_data.items():
-                if hasattr(notebook, key) and value is not None:
-                    setattr(notebook, key, value)
-            await self.session.flush()
-        return notebook
+        """Updates a notebook record with the provided data using UPDATE ... RETURNING."""
+        values = {
+            key: value for key, value in update_data.items()
+            if key in Notebook.__table__.c and value is not None
+        }
+        if not values:
+            return await self.get_by_id(notebook_id)
+
+        stmt = (
+            update(Notebook)
+            .where(Notebook.id == notebook_id)
+            .values(**values)
+            .returning(Notebook)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def touch_many(self, notebook_ids: Iterable[str]) -> None:
+        """
+        Sets updated_at to the database's now() on several notebooks with one UPDATE.
+        Note: This method does NOT commit.
+        """
+        # Sorted, so concurrent flushes from several workers lock rows in the same order
+        ids = sorted(uuid.UUID(str(notebook_id)) for notebook_id in notebook_ids)
+        if not ids:
+            return
+        stmt = (
+            update(Notebook)
+            .where(Notebook.id.in_(ids))
+            .values(updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
 
     async def delete_by_id(self, notebook_id: str) -> bool:
-        """Deletes a notebook by its ID."""
-        notebook = await self.get_by_id(notebook_id)
-        if notebook:
-            await self.session.delete(notebook)
-            await self.session.flush()
-            return True
-        return False
+        """
+        Deletes a notebook by its ID with a single DELETE ... RETURNING.
+        Dependent rows are removed by the database's ON DELETE CASCADE.
+        """
+        stmt = delete(Notebook).where(Notebook.id == notebook_id).returning(Notebook.id)
+        result = await self.session.execute(stmt)
+        return result.first() is not None
 
     async def get_by_id_with_threads(self, notebook_id: str) -> Optional[Notebook]:
         """Retrieves a notebook with all its threads eagerly loaded."""
-        stmt = select(Notebook).options(selectinload(Notebook.threads)).where(Notebook.id == notebook_id)
+        stmt = select(Notebook).options(selectinload(Notebook.threads), raiseload("*")).where(Notebook.id == notebook_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def list_threads_for_notebook(self, notebook_id: str) -> List[Thread]:
         """Retrieves all threads for a specific notebook."""
-        stmt = select(Thread).where(Thread.notebook_id == notebook_id).order_by(Thread.created_at.desc())
+        stmt = (
+            select(Thread)
+            .join(Chat, Chat.thread_id == Thread.thread_id)
+            .where(Chat.notebook_id == notebook_id)
+            .distinct()
+            .order_by(Thread.created_at.desc())
+        )
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_chats_for_notebook(self, notebook_id: str) -> List[Chat]:
-        """Retrieves all chats for a specific notebook (through threads)."""
-        stmt = (
-            select(Chat)
-            .join(Thread, Chat.thread_id == Thread.thread_id)
-            .where(Thread.notebook_id == notebook_id)
-            .order_by(Chat.created_at.desc())
-        )
+        """Retrieves all chats for a specific notebook."""
+        stmt = select(Chat).where(Chat.notebook_id == notebook_id).order_by(Chat.created_at.desc())
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
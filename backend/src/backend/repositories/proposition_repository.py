@@ -1,4 +1,5 @@
 from typing import Optional, Dict, Any
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
@@ -20,15 +21,20 @@ class PropositionRepository:
         """Creates a new Proposition object and adds it to the session."""
         proposition = Proposition(notebook_id=notebook_id, **data)
         self.session.add(proposition)
-        await self.session.flush()
         return proposition
 
     async def update(self, notebook_id: uuid.UUID, data: Dict[str, Any]) -> Optional[Proposition]:
-        """Updates a proposition record with the provided data."""
-        proposition = await self.get_by_id(notebook_id)
-        if proposition:
-            for key, value in data.items():
-                if hasattr(proposition, key):
-                    setattr(proposition, key, value)
-            await self.session.flush()
-        return proposition
\ No newline at end of file
+        """Updates a proposition record with the provided data using UPDATE ... RETURNING."""
+        values = {key: value for key, value in data.items() if key in Proposition.__table__.c}
+        if not values:
+            return await self.get_by_id(notebook_id)
+
+        stmt = (
+            update(Proposition)
+            .where(Proposition.notebook_id == notebook_id)
+            .values(**values)
+            .returning(Proposition)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
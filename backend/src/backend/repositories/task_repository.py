@@ -1,11 +1,82 @@
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime
-from sqlalchemy import select, delete, and_, func, or_
+import base64
+import json
+import uuid
+from dataclasses import fields
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timezone
+from sqlalchemy import select, update, delete, and_, func, or_, case, literal, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from backend.models.task import Task, TaskStatus, TaskPriority
+from sqlalchemy.orm.attributes import set_committed_value
+from backend.models.task import Task, TaskListRow, TaskStatus, TaskPriority
 from backend.models.notebook import Notebook
 
+# Columns hydrated into TaskListRow, in field order
+_TASK_LIST_COLUMNS = tuple(getattr(Task, field.name) for field in fields(TaskListRow))
+
+# Rows fetched per round trip when streaming task listings
+LIST_YIELD_PER = 500
+
+# Columns written by bulk_create_tasks; created_at/updated_at take their server defaults
+_COPY_COLUMNS = (
+    'id', 'user_id', 'notebook_id', 'title', 'description', 'status',
+    'priority', 'tags', 'due_date', 'position', 'archived'
+)
+
+# Keyset position of a task in the (status, position, created_at DESC, id) ordering
+TaskCursor = Tuple[str, int, datetime, uuid.UUID]
+
+
+def encode_task_cursor(task: Union[Task, TaskListRow]) -> str:
+    """
+    Encodes the sort key of a task into an opaque, URL-safe cursor
+    pointing just past that task.
+    """
+    payload = [task.status, task.position, task.created_at.isoformat(), str(task.id)]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_task_cursor(cursor: str) -> TaskCursor:
+    """
+    Decodes a cursor produced by encode_task_cursor.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        status, position, created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(status), int(position), datetime.fromisoformat(created_at), uuid.UUID(task_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def _tags_overlap(tags: List[str]):
+    """
+    Matches tasks that carry ANY of the given tags (PG `&&`).
+    The tags are bound as one array parameter of the column's own type, so the
+    statement is the same for any number of tags and idx_tasks_tags_gin applies.
+    """
+    return Task.tags.op('&&')(bindparam('tags', value=list(tags), type_=Task.tags.type))
+
+
+def _after_cursor(cursor: TaskCursor):
+    """
+    Builds the seek predicate for rows strictly after the cursor in the
+    (status, position, created_at DESC, id) ordering. A row-value comparison
+    cannot express the mixed sort direction, so it is expanded by hand; the
+    leading status bound lets Postgres start an index range scan.
+    """
+    status, position, created_at, task_id = cursor
+    same_status = Task.status == status
+    same_position = and_(same_status, Task.position == position)
+    return and_(
+        Task.status >= status,
+        or_(
+            Task.status > status,
+            and_(same_status, Task.position > position),
+            and_(same_position, Task.created_at < created_at),
+            and_(same_position, Task.created_at == created_at, Task.id > task_id)
+        )
+    )
+
 
 class TaskRepository:
     """
@@ -43,9 +114,49 @@ class TaskRepository:
             position=position
         )
         self.session.add(task_record)
-        await self.session.flush()  # Send data to DB to get defaults/IDs
         return task_record
 
+    async def bulk_create_tasks(self, rows: List[Dict[str, Any]]) -> List[uuid.UUID]:
+        """
+        Inserts many tasks at once with a binary COPY through the session's
+        asyncpg connection, bypassing per-row INSERTs and the ORM.
+        Each row needs user_id, notebook_id and title; the other task columns
+        are optional. Ownership is not checked here, callers must pass rows
+        for the acting user only.
+        Runs inside the session's transaction. Does not commit.
+        Returns the ids of the inserted tasks, in input order.
+        """
+        if not rows:
+            return []
+
+        records = []
+        for row in rows:
+            due_date = row.get('due_date')
+            if due_date is not None and not isinstance(due_date, datetime):
+                due_date = datetime(due_date.year, due_date.month, due_date.day, tzinfo=timezone.utc)
+            records.append((
+                row.get('id') or uuid.uuid4(),
+                row['user_id'],
+                uuid.UUID(str(row['notebook_id'])),
+                row['title'],
+                row.get('description'),
+                TaskStatus(row.get('status', TaskStatus.TODO)).value,
+                TaskPriority(row.get('priority', TaskPriority.MEDIUM)).value,
+                row.get('tags') or [],
+                due_date,
+                row.get('position', 0),
+                row.get('archived', False)
+            ))
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Task.__tablename__,
+            records=records,
+            columns=_COPY_COLUMNS
+        )
+        return [record[0] for record in records]
+
     async def list_by_user_id(
         self,
         user_id: str,
@@ -54,14 +165,17 @@ class TaskRepository:
         priority: Optional[TaskPriority] = None,
         tags: Optional[List[str]] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         include_archived: bool = False
-    ) -> List[Task]:
+    ) -> List[TaskListRow]:
         """
         Retrieve tasks for a specific user with optional filters,
         ordered by position within status groups.
+        Pages with a keyset cursor (see encode_task_cursor) rather than OFFSET.
+        Rows are selected column-wise and streamed in chunks into plain
+        TaskListRow objects, skipping ORM identity tracking.
         """
-        query = select(Task).where(Task.user_id == user_id)
+        query = select(*_TASK_LIST_COLUMNS).where(Task.user_id == user_id)
 
         if notebook_id:
             query = query.where(Task.notebook_id == notebook_id)
@@ -74,16 +188,19 @@ class TaskRepository:
 
         if tags:
             # Filter tasks that contain ANY of the specified tags
-            query = query.where(Task.tags.overlap(tags))
+            query = query.where(_tags_overlap(tags))
 
         if not include_archived:
             query = query.where(Task.archived == False)
 
-        query = query.order_by(Task.status, Task.position, Task.created_at.desc())
-        query = query.limit(limit).offset(offset)
+        if cursor:
+            query = query.where(_after_cursor(decode_task_cursor(cursor)))
 
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        query = query.order_by(Task.status, Task.position, Task.created_at.desc(), Task.id)
+        query = query.limit(limit).execution_options(yield_per=LIST_YIELD_PER)
+
+        result = await self.session.stream(query)
+        return [TaskListRow(*row) async for row in result]
 
     async def get_by_id_and_user(self, task_id: str, user_id: str) -> Optional[Task]:
         """
@@ -124,25 +241,24 @@ class TaskRepository:
         updates: Dict[str, Any]
     ) -> Optional[Task]:
         """
-        Update a task record with the provided updates dictionary.
+        Update a task record with the provided updates dictionary
+        using a single UPDATE ... RETURNING statement.
         Returns the updated Task instance or None if not found.
         Does not commit the transaction.
         """
-        # First, fetch the existing record
-        existing_query = select(Task).where(Task.id == task_id)
-        result = await self.session.execute(existing_query)
-        existing_task = result.scalars().first()
-
-        if not existing_task:
-            return None
-
-        # Apply updates
-        for key, value in updates.items():
-            if hasattr(existing_task, key):
-                setattr(existing_task, key, value)
-
-        await self.session.flush()  # Flush to update the object
-        return existing_task
+        values = {key: value for key, value in updates.items() if key in Task.__table__.c}
+        if not values:
+            return await self.session.get(Task, task_id)
+
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**values)
+            .returning(Task)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
 
     async def move_task(
         self,
@@ -153,6 +269,8 @@ class TaskRepository:
         """
         Move a task to a new status and position.
         Also updates positions of other tasks in the affected columns.
+        All affected rows, including the moved task, are updated by a single
+        CASE-based UPDATE statement.
         Returns the updated Task instance or None if not found.
         """
         # First, get the current task
@@ -166,148 +284,82 @@ class TaskRepository:
         old_status = current_task.status
         old_position = current_task.position
 
-        # If moving to a different column, decrement positions in old column
-        if old_status != new_status:
-            await self._decrement_positions_after(
-                current_task.user_id,
-                current_task.notebook_id,
-                old_status,
-                old_position
-            )
-
-            # Increment positions in new column at or after the target position
-            await self._increment_positions_at_or_after(
-                current_task.user_id,
-                current_task.notebook_id,
-                new_status,
-                new_position
-            )
+        # (condition, new position) pairs for the tasks shifted by this move
+        position_cases = []
 
-            # Update the task's status and position
-            current_task.status = new_status
-            current_task.position = new_position
-        else:
-            # Moving within the same column
-            if new_position < old_position:
-                # Moving up - increment positions between new and old
-                await self._increment_positions_between(
-                    current_task.user_id,
-                    current_task.notebook_id,
-                    new_status,
-                    new_position,
-                    old_position - 1
-                )
-            elif new_position > old_position:
-                # Moving down - decrement positions between old and new
-                await self._decrement_positions_between(
-                    current_task.user_id,
-                    current_task.notebook_id,
-                    new_status,
-                    old_position + 1,
-                    new_position
+        if old_status != new_status:
+            # Close the gap in the old column, make room in the new one
+            position_cases.append((
+                and_(Task.status == old_status, Task.position > old_position),
+                Task.position - 1
+            ))
+            position_cases.append((
+                and_(Task.status == new_status, Task.position >= new_position),
+                Task.position + 1
+            ))
+        elif new_position < old_position:
+            # Moving up - increment positions between new and old
+            position_cases.append((
+                and_(
+                    Task.status == new_status,
+                    Task.position >= new_position,
+                    Task.position <= old_position - 1
+                ),
+                Task.position + 1
+            ))
+        elif new_position > old_position:
+            # Moving down - decrement positions between old and new
+            position_cases.append((
+                and_(
+                    Task.status == new_status,
+                    Task.position >= old_position + 1,
+                    Task.position <= new_position
+                ),
+                Task.position - 1
+            ))
+
+        is_moved_task = Task.id == current_task.id
+
+        stmt = (
+            update(Task)
+            .where(
+                and_(
+                    Task.user_id == current_task.user_id,
+                    Task.notebook_id == current_task.notebook_id,
+                    or_(is_moved_task, *[condition for condition, _ in position_cases])
                 )
-
-            # Update the task's position
-            current_task.position = new_position
-
-        await self.session.flush()
-        return current_task
-
-    async def _increment_positions_between(
-        self,
-        user_id: str,
-        notebook_id: str,
-        status: TaskStatus,
-        start_position: int,
-        end_position: int
-    ):
-        """Increment positions of tasks in a range."""
-        from sqlalchemy import update
-
-        stmt = update(Task).where(
-            and_(
-                Task.user_id == user_id,
-                Task.notebook_id == notebook_id,
-                Task.status == status,
-                Task.position >= start_position,
-                Task.position <= end_position
-            )
-        ).values(position=Task.position + 1)
-
-        await self.session.execute(stmt)
-
-    async def _decrement_positions_between(
-        self,
-        user_id: str,
-        notebook_id: str,
-        status: TaskStatus,
-        start_position: int,
-        end_position: int
-    ):
-        """Decrement positions of tasks in a range."""
-        from sqlalchemy import update
-
-        stmt = update(Task).where(
-            and_(
-                Task.user_id == user_id,
-                Task.notebook_id == notebook_id,
-                Task.status == status,
-                Task.position >= start_position,
-                Task.position <= end_position
             )
-        ).values(position=Task.position - 1)
-
-        await self.session.execute(stmt)
-
-    async def _increment_positions_at_or_after(
-        self,
-        user_id: str,
-        notebook_id: str,
-        status: TaskStatus,
-        position: int
-    ):
-        """Increment positions of tasks at or after a given position."""
-        from sqlalchemy import update
-
-        stmt = update(Task).where(
-            and_(
-                Task.user_id == user_id,
-                Task.notebook_id == notebook_id,
-                Task.status == status,
-                Task.position >= position
+            .values(
+                status=case((is_moved_task, literal(new_status, Task.status.type)), else_=Task.status),
+                position=case(
+                    (is_moved_task, new_position),
+                    *position_cases,
+                    else_=Task.position
+                )
             )
-        ).values(position=Task.position + 1)
-
+            .execution_options(synchronize_session=False)
+        )
         await self.session.execute(stmt)
 
-    async def _decrement_positions_after(
-        self,
-        user_id: str,
-        notebook_id: str,
-        status: TaskStatus,
-        position: int
-    ):
-        """Decrement positions of tasks after a given position."""
-        from sqlalchemy import update
-
-        stmt = update(Task).where(
-            and_(
-                Task.user_id == user_id,
-                Task.notebook_id == notebook_id,
-                Task.status == status,
-                Task.position > position
-            )
-        ).values(position=Task.position - 1)
-
-        await self.session.execute(stmt)
+        # Reflect the new values on the loaded instance without marking it dirty,
+        # so no second UPDATE is issued for the moved task.
+        set_committed_value(current_task, "status", new_status)
+        set_committed_value(current_task, "position", new_position)
+        return current_task
 
     async def delete(self, task_id: str) -> bool:
         """
-        Delete a task record by ID.
+        Delete a task record by ID with a bulk DELETE.
+        The identity map is not synchronized; a loaded instance of the deleted
+        task must not be used afterwards.
         Returns True if deleted, False otherwise.
         Does not commit the transaction.
         """
-        stmt = delete(Task).where(Task.id == task_id)
+        stmt = (
+            delete(Task)
+            .where(Task.id == task_id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self.session.execute(stmt)
         return result.rowcount > 0
 
@@ -322,11 +374,14 @@ class TaskRepository:
         has_due_date: Optional[bool] = None,
         is_overdue: Optional[bool] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         include_archived: bool = False
-    ) -> List[Task]:
+    ) -> AsyncIterator[Task]:
         """
         Search tasks with multiple filter criteria.
+        Pages with a keyset cursor (see encode_task_cursor) rather than OFFSET.
+        Matches are streamed from a server-side cursor in chunks instead of
+        being buffered, so callers should consume them in a single pass.
         """
         base_query = select(Task).where(Task.user_id == user_id)
 
@@ -340,7 +395,7 @@ class TaskRepository:
             base_query = base_query.where(Task.priority == priority)
 
         if tags:
-            base_query = base_query.where(Task.tags.overlap(tags))
+            base_query = base_query.where(_tags_overlap(tags))
 
         if has_due_date is not None:
             if has_due_date:
@@ -349,7 +404,6 @@ class TaskRepository:
                 base_query = base_query.where(Task.due_date.is_(None))
 
         if is_overdue is not None:
-            from datetime import datetime
             if is_overdue:
                 base_query = base_query.where(
                     and_(
@@ -378,11 +432,15 @@ class TaskRepository:
         if not include_archived:
             base_query = base_query.where(Task.archived == False)
 
-        base_query = base_query.order_by(Task.status, Task.position, Task.created_at.desc())
-        base_query = base_query.limit(limit).offset(offset)
+        if cursor:
+            base_query = base_query.where(_after_cursor(decode_task_cursor(cursor)))
 
-        result = await self.session.execute(base_query)
-        return result.scalars().all()
+        base_query = base_query.order_by(Task.status, Task.position, Task.created_at.desc(), Task.id)
+        base_query = base_query.limit(limit).execution_options(yield_per=LIST_YIELD_PER)
+
+        result = await self.session.stream_scalars(base_query)
+        async for task in result:
+            yield task
 
     async def count_by_user_and_filters(
         self,
@@ -408,6 +466,30 @@ class TaskRepository:
         result = await self.session.execute(query)
         return result.scalar() or 0
 
+    async def get_status_counts(
+        self,
+        user_id: str,
+        notebook_id: Optional[str] = None,
+        include_archived: bool = False
+    ) -> Dict[TaskStatus, int]:
+        """
+        Count tasks per status for a user (optionally within a notebook)
+        in a single scan, using COUNT(*) FILTER (WHERE status = ...).
+        """
+        query = select(
+            *[func.count().filter(Task.status == status).label(status.name) for status in TaskStatus]
+        ).where(Task.user_id == user_id)
+
+        if notebook_id:
+            query = query.where(Task.notebook_id == notebook_id)
+
+        if not include_archived:
+            query = query.where(Task.archived == False)
+
+        result = await self.session.execute(query)
+        row = result.one()
+        return {status: getattr(row, status.name) or 0 for status in TaskStatus}
+
     async def list_by_user_id_without_notebook_filter(
         self,
         user_id: str,
@@ -416,11 +498,12 @@ class TaskRepository:
         priority: Optional[TaskPriority] = None,
         tags: Optional[List[str]] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         include_archived: bool = False
     ) -> List[Task]:
         """
         Retrieve tasks for a specific user across all notebooks with optional filters.
+        Uses the same ordering and keyset cursor as list_by_user_id.
         """
         query = select(Task).where(Task.user_id == user_id)
 
@@ -435,13 +518,16 @@ class TaskRepository:
 
         if tags:
             # Filter tasks that contain ANY of the specified tags
-            query = query.where(Task.tags.overlap(tags))
+            query = query.where(_tags_overlap(tags))
 
         if not include_archived:
             query = query.where(Task.archived == False)
 
-        query = query.order_by(Task.notebook_id, Task.status, Task.position, Task.created_at.desc())
-        query = query.limit(limit).offset(offset)
+        if cursor:
+            query = query.where(_after_cursor(decode_task_cursor(cursor)))
+
+        query = query.order_by(Task.status, Task.position, Task.created_at.desc(), Task.id)
+        query = query.limit(limit)
 
         result = await self.session.execute(query)
         return result.scalars().all()
\ No newline at end of file
@@ -1,6 +1,6 @@
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Optional, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.models.thread import Thread
@@ -9,16 +9,16 @@ class ThreadRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, thread_id: str) -> Thread:
+    async def create(self, thread_id: Union[str, uuid.UUID]) -> Thread:
         """
         Creates a new Thread object and adds it to the session.
         Note: This method does NOT commit. The service layer is responsible for the commit.
         """
+        now = datetime.now(timezone.utc)
         new_thread = Thread(
-            thread_id=uuid.UUID(thread_id),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            thread_id=thread_id if isinstance(thread_id, uuid.UUID) else uuid.UUID(thread_id),
+            created_at=now,
+            updated_at=now
         )
         self.session.add(new_thread)
-        await self.session.flush() # flush sends the command to the DB to get IDs, etc.
         return new_thread
\ No newline at end of file
@@ -1,9 +1,22 @@
 import uuid
-from sqlalchemy import select
+from sqlalchemy import select, bindparam, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.user import User
 
+# Lookup statements are built once at import time and reused with fresh
+# bound parameters, instead of rebuilding the expression on every call.
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+# Two single-index probes glued with UNION ALL rather than an OR across two
+# columns; the email branch runs first and LIMIT 1 stops as soon as it matches.
+_USER_BY_EMAIL_OR_USERNAME = select(User).from_statement(
+    union_all(
+        select(User).where(User.email == bindparam("identifier")),
+        select(User).where(User.username == bindparam("identifier"))
+    ).limit(1)
+)
+
 
 class UserRepository:
     """
@@ -26,20 +39,17 @@ class UserRepository:
 
     async def get_by_email(self, email: str) -> User | None:
         """Retrieves a user by their email address."""
-        stmt = select(User).where(User.email == email)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalars().first()
 
     async def get_by_username(self, username: str) -> User | None:
         """Retrieves a user by their username."""
-        stmt = select(User).where(User.username == username)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_USER_BY_USERNAME, {"username": username})
         return result.scalars().first()
 
     async def get_by_email_or_username(self, identifier: str) -> User | None:
         """Retrieves a user by either their email or username."""
-        stmt = select(User).where((User.email == identifier) | (User.username == identifier))
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_USER_BY_EMAIL_OR_USERNAME, {"identifier": identifier})
         return result.scalars().first()
 
     def add(self, user: User) -> None:
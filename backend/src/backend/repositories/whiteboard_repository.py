@@ -1,10 +1,67 @@
-from typing import List, Optional, Dict, Any
+import base64
+import json
+import re
+import uuid
 from datetime import datetime
-from sqlalchemy import select, delete, and_, func, or_
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import select, update, delete, func, lambda_stmt, literal_column, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from backend.models.whiteboard import Whiteboard
 
+# Queries shorter than this are matched by substring instead of full-text search
+MIN_FTS_QUERY_LENGTH = 3
+
+# Must match the expression of idx_whiteboards_title_fts exactly for the index to be used.
+# The constants are rendered inline, since a bound parameter would not match the index.
+_FTS_CONFIG = literal_column("'simple'::regconfig")
+_TITLE_TSVECTOR = func.to_tsvector(_FTS_CONFIG, func.coalesce(Whiteboard.title, literal_column("''")))
+
+def _without_content():
+    """
+    Loader option for listings that don't render the board itself: skips the (often
+    large) content JSON, and raises instead of lazy-loading it if it is accessed.
+    Built on use rather than at import, since building it configures every mapper.
+    """
+    return defer(Whiteboard.content, raiseload=True)
+
+# Keyset position of a whiteboard in the (updated_at DESC, id DESC) ordering
+WhiteboardCursor = Tuple[datetime, uuid.UUID]
+
+
+def encode_whiteboard_cursor(whiteboard: Whiteboard) -> str:
+    """
+    Encodes the sort key of a whiteboard into an opaque, URL-safe cursor
+    pointing just past that whiteboard.
+    """
+    payload = [whiteboard.updated_at.isoformat(), str(whiteboard.id)]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_whiteboard_cursor(cursor: str) -> WhiteboardCursor:
+    """
+    Decodes a cursor produced by encode_whiteboard_cursor.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        updated_at, whiteboard_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(updated_at), uuid.UUID(whiteboard_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def _prefix_tsquery(query: str) -> Optional[str]:
+    """
+    Turns free text into a tsquery that matches every word as a prefix
+    ("white bo" -> "white:* & bo:*"), so partially typed words still match.
+    Only word characters are kept, so user input cannot inject tsquery syntax.
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
 
 class WhiteboardRepository:
     """
@@ -34,40 +91,23 @@ class WhiteboardRepository:
             thumbnail_url=thumbnail_url
         )
         self.session.add(whiteboard_record)
-        await self.session.flush()  # Send data to DB to get defaults/IDs
         return whiteboard_record
 
-    async def list_by_user_id(
-        self,
-        user_id: str,
-        notebook_id: Optional[str] = None,
-        limit: int = 100,
-        offset: int = 0
-    ) -> List[Whiteboard]:
-        """
-        Retrieve whiteboards for a specific user with optional filters,
-        ordered by updated_at descending.
-        """
-        query = select(Whiteboard).where(Whiteboard.user_id == user_id)
-
-        if notebook_id:
-            query = query.where(Whiteboard.notebook_id == notebook_id)
-
-        query = query.order_by(Whiteboard.updated_at.desc())
-        query = query.limit(limit).offset(offset)
-
-        result = await self.session.execute(query)
-        return result.scalars().all()
-
     async def get_by_id_and_user(self, whiteboard_id: str, user_id: str) -> Optional[Whiteboard]:
         """
         Retrieve a whiteboard by ID and user ID to verify ownership.
+        Looks the primary key up with session.get, so a whiteboard already
+        loaded in this session is returned without another query.
         """
-        query = select(Whiteboard).where(
-            and_(Whiteboard.id == whiteboard_id, Whiteboard.user_id == user_id)
-        )
-        result = await self.session.execute(query)
-        return result.scalars().first()
+        try:
+            whiteboard_uuid = uuid.UUID(str(whiteboard_id))
+        except ValueError:
+            return None
+
+        whiteboard = await self.session.get(Whiteboard, whiteboard_uuid)
+        if whiteboard is None or whiteboard.user_id != user_id:
+            return None
+        return whiteboard
 
     async def update(
         self,
@@ -75,25 +115,24 @@ class WhiteboardRepository:
         updates: Dict[str, Any]
     ) -> Optional[Whiteboard]:
         """
-        Update a whiteboard record with the provided updates dictionary.
+        Update a whiteboard record with the provided updates dictionary
+        using a single UPDATE ... RETURNING statement.
         Returns the updated Whiteboard instance or None if not found.
         Does not commit the transaction.
         """
-        # First, fetch the existing record
-        existing_query = select(Whiteboard).where(Whiteboard.id == whiteboard_id)
-        result = await self.session.execute(existing_query)
-        existing_whiteboard = result.scalars().first()
+        values = {key: value for key, value in updates.items() if key in Whiteboard.__table__.c}
+        if not values:
+            return await self.session.get(Whiteboard, whiteboard_id)
 
-        if not existing_whiteboard:
-            return None
-
-        # Apply updates
-        for key, value in updates.items():
-            if hasattr(existing_whiteboard, key):
-                setattr(existing_whiteboard, key, value)
-
-        await self.session.flush()  # Flush to update the object
-        return existing_whiteboard
+        stmt = (
+            update(Whiteboard)
+            .where(Whiteboard.id == whiteboard_id)
+            .values(**values)
+            .returning(Whiteboard)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
 
     async def delete(self, whiteboard_id: str) -> bool:
         """
@@ -101,36 +140,122 @@ class WhiteboardRepository:
         Returns True if deleted, False otherwise.
         Does not commit the transaction.
         """
-        stmt = delete(Whiteboard).where(Whiteboard.id == whiteboard_id)
+        stmt = (
+            delete(Whiteboard)
+            .where(Whiteboard.id == whiteboard_id)
+            .returning(Whiteboard.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self.session.execute(stmt)
-        return result.rowcount > 0
+        return result.scalar_one_or_none() is not None
 
-    async def search_whiteboards(
+    @staticmethod
+    def _apply_search(
+        stmt: StatementLambdaElement,
+        user_id: str,
+        notebook_id: Optional[str] = None,
+        query: Optional[str] = None,
+        fuzzy: bool = False,
+        cursor: Optional[str] = None,
+        ordered: bool = True
+    ) -> StatementLambdaElement:
+        """
+        Adds the shared whiteboard filters and ordering to a lambda statement,
+        so each combination of filters is constructed and compiled once and
+        later calls only bind values.
+        Titles are matched with full-text search on the GIN-indexed title
+        tsvector; very short queries fall back to a substring match.
+        With fuzzy=True, titles are instead matched by trigram similarity
+        (tolerating typos) and ordered by it, most similar first.
+        A cursor restricts the rows to those after it in the
+        (updated_at DESC, id DESC) ordering, so it cannot be combined with
+        fuzzy, which orders by similarity.
+        With ordered=False no ORDER BY is added (for counts).
+        """
+        stmt += lambda s: s.where(Whiteboard.user_id == user_id)
+
+        if notebook_id:
+            stmt += lambda s: s.where(Whiteboard.notebook_id == notebook_id)
+
+        if cursor:
+            if fuzzy:
+                raise ValueError("Cursor pagination is not supported for relevance-ordered searches")
+            after_updated_at, after_id = decode_whiteboard_cursor(cursor)
+            stmt += lambda s: s.where(tuple_(Whiteboard.updated_at, Whiteboard.id) < tuple_(after_updated_at, after_id))
+
+        if query and fuzzy:
+            # title % query uses the trigram index (pg_trgm.similarity_threshold, 0.3 by default)
+            stmt += lambda s: s.where(Whiteboard.title.op('%')(query))
+            if ordered:
+                stmt += lambda s: s.order_by(func.similarity(Whiteboard.title, query).desc())
+        elif query:
+            tsquery_text = _prefix_tsquery(query) if len(query.strip()) >= MIN_FTS_QUERY_LENGTH else None
+            if tsquery_text:
+                stmt += lambda s: s.where(_TITLE_TSVECTOR.op('@@')(func.to_tsquery(_FTS_CONFIG, tsquery_text)))
+            else:
+                search_term = f"%{query}%"
+                stmt += lambda s: s.where(Whiteboard.title.ilike(search_term))
+
+        if ordered:
+            stmt += lambda s: s.order_by(Whiteboard.updated_at.desc(), Whiteboard.id.desc())
+        return stmt
+
+    async def list_with_total(
         self,
         user_id: str,
         notebook_id: Optional[str] = None,
         query: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
-    ) -> List[Whiteboard]:
+        offset: int = 0,
+        fuzzy: bool = False,
+        cursor: Optional[str] = None,
+        include_content: bool = True
+    ) -> Tuple[List[Whiteboard], Optional[int]]:
         """
-        Search whiteboards with multiple filter criteria.
+        Retrieve one page of whiteboards together with the total number of
+        matches, in a single query: COUNT(*) OVER () is evaluated on the
+        filtered rows before LIMIT/OFFSET apply.
+        With a cursor the window would only count the rows after it, and a
+        separate COUNT would scan every match on each page, so cursor pages
+        return None as the total; the client keeps the first page's total.
+        With include_content=False the content column is not loaded.
+        A cursor already marks where the page starts, so it cannot be
+        combined with an offset.
         """
-        base_query = select(Whiteboard).where(Whiteboard.user_id == user_id)
+        if cursor and offset:
+            raise ValueError("Cursor pagination cannot be combined with offset")
+        if cursor:
+            stmt = self._apply_search(
+                lambda_stmt(lambda: select(Whiteboard)),
+                user_id, notebook_id, query, fuzzy=fuzzy, cursor=cursor
+            )
+        else:
+            stmt = self._apply_search(
+                lambda_stmt(lambda: select(Whiteboard, func.count().over().label('total'))),
+                user_id, notebook_id, query, fuzzy=fuzzy
+            )
 
-        if notebook_id:
-            base_query = base_query.where(Whiteboard.notebook_id == notebook_id)
+        if not include_content:
+            stmt += lambda s: s.options(_without_content())
+        stmt += lambda s: s.limit(limit).offset(offset)
 
-        if query:
-            # Text search in title
-            search_term = f"%{query}%"
-            base_query = base_query.where(Whiteboard.title.ilike(search_term))
+        result = await self.session.execute(stmt)
+        if cursor:
+            return list(result.scalars().all()), None
 
-        base_query = base_query.order_by(Whiteboard.updated_at.desc())
-        base_query = base_query.limit(limit).offset(offset)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if not offset:
+            return [], 0
 
-        result = await self.session.execute(base_query)
-        return result.scalars().all()
+        # Paged past the end: no row carries the total, so count separately
+        count_stmt = self._apply_search(
+            lambda_stmt(lambda: select(func.count()).select_from(Whiteboard)),
+            user_id, notebook_id, query, fuzzy=fuzzy, ordered=False
+        )
+        result = await self.session.execute(count_stmt)
+        return [], result.scalar() or 0
 
     async def count_by_user_and_filters(
         self,
@@ -140,10 +265,10 @@ class WhiteboardRepository:
         """
         Count whiteboards for a user with optional filters.
         """
-        query = select(func.count(Whiteboard.id)).where(Whiteboard.user_id == user_id)
+        query = lambda_stmt(lambda: select(func.count()).select_from(Whiteboard).where(Whiteboard.user_id == user_id))
 
         if notebook_id:
-            query = query.where(Whiteboard.notebook_id == notebook_id)
+            query += lambda s: s.where(Whiteboard.notebook_id == notebook_id)
 
         result = await self.session.execute(query)
         return result.scalar() or 0
\ No newline at end of file
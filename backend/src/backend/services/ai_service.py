@@ -1,94 +1,238 @@
 # backend/services/ai_service.py
 
-import base64
+import asyncio
+import logging
 import os
-from typing import List
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, DefaultDict, Dict, List, Optional, Set
 
 from dotenv import load_dotenv
-from langgraph_sdk import get_client
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.models.dtos.chat import SendMessageRequest, MessageResponse
+from backend.models.notebook_model import NotebookModel
+from backend.repositories.assistant_repository import AssistantRepository, get_cached_assistant_id
 from backend.services.assistant_service import AssistantService
-from backend.services.model_api_service import ModelApiService
+from backend.services.langgraph_client import create_stateless_run
+from backend.services.model_api_service import ModelApiService, read_encrypted_api_key
 from backend.services.notebook_model_service import NotebookModelService
 
 load_dotenv()
-LANGGRAPH_URL = os.getenv("LANGGRAPH_URL")
 LANGGRAPH_WEBHOOK_URL = os.getenv("LANGGRAPH_WEBHOOK_URL")
 
+logger = logging.getLogger(__name__)
+
+# Run creations still in flight. The event loop only keeps weak references to
+# tasks, so they are held here until done.
+_background_runs: Set[asyncio.Task] = set()
+
+# Most run creations held at once. Each is normally done within one batch window
+# and round trip; if LangGraph stalls, new dispatches are refused instead of
+# piling up payloads (with the users' API keys) in memory.
+MAX_BACKGROUND_RUNS = 1000
+
+# Seconds a client refused with AIRunsBusyError is asked to wait before retrying
+RUNS_BUSY_RETRY_AFTER = 5
+
+
+class AIRunsBusyError(RuntimeError):
+    """
+    Raised when a dispatch is refused because MAX_BACKGROUND_RUNS run creations
+    are already in flight. The request itself was fine and can be retried.
+    """
+
+    def __init__(self, in_flight: int, retry_after: int = RUNS_BUSY_RETRY_AFTER):
+        super().__init__(f"Too many AI runs are being started ({in_flight}); please try again shortly.")
+        self.retry_after = retry_after
+
+
+def _on_run_created(task: asyncio.Task) -> None:
+    _background_runs.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed to start LangGraph run", exc_info=task.exception())
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """Default graph and result webhook of a background agent run."""
+    graph_id: str
+    webhook_path: str
+
+
+# Every background agent run started by AIService, keyed by operation
+_AGENT_SPECS: Dict[str, AgentSpec] = {
+    "transcription": AgentSpec("transcription_agent", "/transcription-hook"),
+    "chat_name": AgentSpec("chat_name_agent", "/chat-name-creation"),
+    "whiteboard_content": AgentSpec("chat_agent", "/whiteboard-generation"),
+    "idea_proposition": AgentSpec("idea_proposition_graph", "/idea-proposition-hook"),
+    "file_name": AgentSpec("file_name_graph", "/file-name-hook"),
+    "content_rewrite": AgentSpec("content_rewriter_graph", "/content-rewriter-hook"),
+    "task_generation": AgentSpec("task_generation_graph", "/task-generation-hook"),
+}
+
 
 class AIService:
     """
     Orchestrates chat-related business logic.
     """
 
+    # One lock per graph_id, so concurrent cache misses for the same graph_id
+    # query it once while misses for different graph_ids don't wait on each other.
+    # Class-level, as the service itself is created per request.
+    _ASSISTANT_ID_LOCKS: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
     def __init__(
             self,
             session: AsyncSession,
             model_api_service: ModelApiService,
             notebook_model_service: NotebookModelService,
             assistant_service: AssistantService,
+            session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
     ):
         self.session = session
         self.model_api_service = model_api_service
         self.notebook_model_service = notebook_model_service
         self.assistant_service = assistant_service
-        self.langgraph_client = get_client(url=LANGGRAPH_URL)
+        # Lets the API key and assistant lookups run on their own short-lived sessions
+        # in parallel with the notebook model lookup; the request session is not shareable.
+        self.session_factory = session_factory
 
-    async def _get_assistant_id(self, graph_id: str) -> str:
-        """Lazy loads the assistant ID for a given graph_id."""
-        assistant = await self.assistant_service.get_assistant_by_graph_id(graph_id)
-        if assistant is None:
-            raise ValueError(f"Assistant with graph_id '{graph_id}' not found.")
-        return str(assistant.assistant_id)
+    async def get_assistant_id(self, graph_id: str) -> str:
+        """
+        Returns the assistant ID for a given graph_id from the assistant cache
+        preloaded at startup; an assistant registered since, or cached for longer
+        than ASSISTANT_CACHE_TTL, is read from the database (and then cached).
+        """
+        cached = get_cached_assistant_id(graph_id)
+        if cached is not None:
+            return cached
+
+        async with self._ASSISTANT_ID_LOCKS[graph_id]:
+            cached = get_cached_assistant_id(graph_id)
+            if cached is not None:
+                return cached
+
+            if self.session_factory is None:
+                assistant = await self.assistant_service.get_assistant_by_graph_id(graph_id)
+            else:
+                # Own session, so the lookup can run alongside the request session's work
+                async with self.session_factory() as session:
+                    assistant = await AssistantRepository(session).get_by_graph_id(graph_id)
+
+            if assistant is None:
+                raise ValueError(f"Assistant with graph_id '{graph_id}' not found.")
+            return str(assistant.assistant_id)
+
+    async def _get_api_key(self, user_id: str) -> Optional[str]:
+        """
+        Returns the user's encrypted API key value, from the short-lived key cache
+        when possible; otherwise reads it, on its own session when a factory is set.
+        """
+        if self.session_factory is None:
+            return await self.model_api_service.get_encrypted_api_key_value(user_id)
+        return await read_encrypted_api_key(user_id, self.session_factory)
 
-    async def transcribe_file(
+    async def _get_light_notebook_model(self, notebook_id: str, user_id: str) -> Optional[NotebookModel]:
+        """
+        Gets the notebook's light model, memoized in the request session's info
+        dict so several dispatches within one request only look it up once.
+        """
+        key = ("notebook_model", notebook_id, "light", user_id)
+        notebook_model = self.session.info.get(key)
+        if notebook_model is None:
+            notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
+                notebook_id=notebook_id,
+                model_type="light",
+                user_id=user_id
+            )
+            if notebook_model is not None:
+                self.session.info[key] = notebook_model
+        return notebook_model
+
+    async def _dispatch(
             self,
+            agent: str,
             notebook_id: str,
             user_id: str,
-            file_id: str,
-            file_url: str,  # <--- Changed from bytes/base64 to URL
-            filename: str,
-            content_type: str,
-            graph_id: str = "transcription_agent",
-            target_file_id: str = None,  # <--- 1. Add this parameter
+            run_input: Dict[str, Any],
+            metadata: Dict[str, Any],
+            graph_id: Optional[str] = None,
     ):
         """
-        Initiates a LangGraph run to transcribe a file hosted at the given URL.
+        Starts a background LangGraph run for one of the _AGENT_SPECS operations.
+        Resolves the notebook's light model, the user's API key and the assistant
+        concurrently, and adds the model and key to run_input.
         """
-        notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-            notebook_id=notebook_id,
-            model_type="light",
-            user_id=user_id
-        )
+        spec = _AGENT_SPECS[agent]
+        graph_id = graph_id or spec.graph_id
+
+        if self.session_factory is None:
+            notebook_model = await self._get_light_notebook_model(notebook_id, user_id)
+            api_key = await self._get_api_key(user_id)
+            assistant_id = await self.get_assistant_id(graph_id)
+        else:
+            # The notebook model lookup may create a default model, so it stays on
+            # the request session; the key and assistant are read on their own.
+            # return_exceptions lets every lookup finish before an error is raised,
+            # so none is left running on the request session afterwards
+            results = await asyncio.gather(
+                self._get_light_notebook_model(notebook_id, user_id),
+                self._get_api_key(user_id),
+                self.get_assistant_id(graph_id),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            notebook_model, api_key, assistant_id = results
 
         if not notebook_model:
             raise ValueError(f"No notebook model found for: {notebook_id}")
 
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
-
         # Require API key for all AI operations
-        if not model_api:
+        if not api_key:
             raise ValueError("API key is required to use this application. Please set up your API key in the settings.")
 
-        # Input to the Agent: It should download the file from the file_url
-        run_input = {
-            "light_model": notebook_model.model.name,
-            "api_key": model_api.value,
-            "file_url": file_url,  # <--- Passing S3 URL
-            "filename": filename,
-            "content_type": content_type
-        }
-
-        assistant_id = await self._get_assistant_id(graph_id)
-        webhook_url = LANGGRAPH_WEBHOOK_URL + "/transcription-hook"
-
-        background_run = await self.langgraph_client.runs.create(
-            thread_id=None,
-            assistant_id=assistant_id,
-            input=run_input,
-            webhook=webhook_url,
+        if len(_background_runs) >= MAX_BACKGROUND_RUNS:
+            raise AIRunsBusyError(len(_background_runs))
+
+        # Everything that can fail on the caller's input has been checked above;
+        # the run itself is created in the background so the request doesn't
+        # wait on the LangGraph round trip. Results arrive through the webhook.
+        task = asyncio.create_task(create_stateless_run({
+            "assistant_id": assistant_id,
+            "input": {
+                "light_model": notebook_model.model.name,
+                "api_key": api_key,
+                **run_input
+            },
+            "webhook": LANGGRAPH_WEBHOOK_URL + spec.webhook_path,
+            "metadata": metadata,
+            "on_completion": "keep",
+        }))
+        _background_runs.add(task)
+        task.add_done_callback(_on_run_created)
+
+        return {"status": "started"}
+
+    async def transcribe_file(
+            self,
+            notebook_id: str,
+            user_id: str,
+            file_id: str,
+            file_url: str,
+            filename: str,
+            content_type: str,
+            graph_id: Optional[str] = None,
+            target_file_id: str = None,
+    ):
+        """
+        Initiates a LangGraph run to transcribe a file hosted at the given URL.
+        The agent downloads the file from file_url itself.
+        """
+        return await self._dispatch(
+            "transcription", notebook_id, user_id,
+            run_input={"file_url": file_url, "filename": filename, "content_type": content_type},
             metadata={
                 "file_id": file_id,
                 "temp_thread": True,
@@ -96,51 +240,23 @@ class AIService:
                 "notebook_id": notebook_id,
                 "target_file_id": target_file_id
             },
-            on_completion="keep",
+            graph_id=graph_id,
         )
 
-        return {"status": "started"}
-
     async def generate_chat_name(
             self,
             notebook_id: str,
             user_id: str,
             request: SendMessageRequest,
-            graph_id: str = "chat_name_agent"
+            graph_id: Optional[str] = None
     ):
-        notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-            notebook_id=notebook_id,
-            model_type="light",
-            user_id=user_id
-        )
-
-        if not notebook_model:
-            raise ValueError(f"No notebook model found for: {notebook_id}")
-
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
-
-        if not model_api:
-            raise ValueError("API key is required.")
-
-        run_input = {
-            "light_model": notebook_model.model.name,
-            "api_key": model_api.value,
-            "first_message": request.first_message,
-        }
-
-        assistant_id = await self._get_assistant_id(graph_id)
-
-        background_run = await self.langgraph_client.runs.create(
-            thread_id=None,
-            assistant_id=assistant_id,
-            input=run_input,
-            webhook=LANGGRAPH_WEBHOOK_URL + "/chat-name-creation",
+        return await self._dispatch(
+            "chat_name", notebook_id, user_id,
+            run_input={"first_message": request.first_message},
             metadata={"chat_id": request.chat_id, "temp_thread": True},
-            on_completion="keep",
+            graph_id=graph_id,
         )
 
-        return {"status": "started"}
-
     async def generate_whiteboard_content(
             self,
             notebook_id: str,
@@ -148,220 +264,89 @@ class AIService:
             parent_content: str,
             node_type: str,
             generation_context: dict,
-            graph_id: str = "chat_agent"
+            graph_id: Optional[str] = None
     ):
-        notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-            notebook_id=notebook_id,
-            model_type="light",
-            user_id=user_id
-        )
-
-        if not notebook_model:
-            raise ValueError(f"No notebook model found for: {notebook_id}")
-
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
-
-        if not model_api:
-            raise ValueError("API key is required.")
-
-        run_input = {
-            "light_model": notebook_model.model.name,
-            "api_key": model_api.value,
-            "text_input": parent_content,
-            "mode": "brainstorm",
-        }
-
-        assistant_id = await self._get_assistant_id(graph_id)
-
-        background_run = await self.langgraph_client.runs.create(
-            thread_id=None,
-            assistant_id=assistant_id,
-            input=run_input,
-            webhook=LANGGRAPH_WEBHOOK_URL + "/whiteboard-generation",
+        return await self._dispatch(
+            "whiteboard_content", notebook_id, user_id,
+            run_input={"text_input": parent_content, "mode": "brainstorm"},
             metadata={
                 "generation_context": generation_context,
                 "temp_thread": True,
                 "user_id": user_id,
                 "notebook_id": notebook_id
             },
-            on_completion="keep",
+            graph_id=graph_id,
         )
 
-        return {"status": "started"}
-
     async def generate_idea_proposition(
             self,
             notebook_id: str,
             user_id: str,
             messages: List[MessageResponse],
-            graph_id: str = "idea_proposition_graph"
+            graph_id: Optional[str] = None
     ):
-        notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-            notebook_id=notebook_id,
-            model_type="light",
-            user_id=user_id
-        )
-
-        if not notebook_model:
-            raise ValueError(f"No notebook model found for: {notebook_id}")
-
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
-
-        if not model_api:
-            raise ValueError("API key is required.")
-
-        run_input = {
-            "light_model": notebook_model.model.name,
-            "api_key": model_api.value,
-            "messages": messages,
-        }
-
-        assistant_id = await self._get_assistant_id(graph_id)
-
-        background_run = await self.langgraph_client.runs.create(
-            thread_id=None,
-            assistant_id=assistant_id,
-            input=run_input,
-            webhook=LANGGRAPH_WEBHOOK_URL + "/idea-proposition-hook",
+        return await self._dispatch(
+            "idea_proposition", notebook_id, user_id,
+            run_input={"messages": messages},
             metadata={"notebook_id": str(notebook_id)},
-            on_completion="keep",
+            graph_id=graph_id,
         )
 
-        return {"status": "started"}
-
     async def generate_file_name(
             self,
             notebook_id: str,
             user_id: str,
             doc_content: str,
             file_id: str,
-            graph_id: str = "file_name_graph"
+            graph_id: Optional[str] = None
     ):
-        notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-            notebook_id=notebook_id,
-            model_type="light",
-            user_id=user_id
-        )
-
-        if not notebook_model:
-            raise ValueError(f"No notebook model found for: {notebook_id}")
-
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
-
-        if not model_api:
-            raise ValueError("API key is required.")
-
-        run_input = {
-            "light_model": notebook_model.model.name,
-            "api_key": model_api.value,
-            "doc_content": doc_content,
-        }
-
-        assistant_id = await self._get_assistant_id(graph_id)
-
-        background_run = await self.langgraph_client.runs.create(
-            thread_id=None,
-            assistant_id=assistant_id,
-            input=run_input,
-            webhook=LANGGRAPH_WEBHOOK_URL + "/file-name-hook",
+        return await self._dispatch(
+            "file_name", notebook_id, user_id,
+            run_input={"doc_content": doc_content},
             metadata={"notebook_id": str(notebook_id), "file_id": file_id, "user_id": user_id},
-            on_completion="keep",
+            graph_id=graph_id,
         )
 
-        return {"status": "started"}
-    
     async def rewrite_content(
             self,
             notebook_id: str,
             user_id: str,
             original_content: str,
             file_id: str,
-            graph_id: str = "content_rewriter_graph"
+            graph_id: Optional[str] = None
     ):
         """
         Initiates a LangGraph run to rewrite content for clarity and precision.
         """
-        notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-            notebook_id=notebook_id,
-            model_type="light",
-            user_id=user_id
-        )
-
-        if not notebook_model:
-            raise ValueError(f"No notebook model found for: {notebook_id}")
-
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
-
-        if not model_api:
-            raise ValueError("API key is required.")
-
-        run_input = {
-            "light_model": notebook_model.model.name,
-            "api_key": model_api.value,
-            "original_content": original_content,
-        }
-
-        assistant_id = await self._get_assistant_id(graph_id)
-
-        background_run = await self.langgraph_client.runs.create(
-            thread_id=None,
-            assistant_id=assistant_id,
-            input=run_input,
-            webhook=LANGGRAPH_WEBHOOK_URL + "/content-rewriter-hook",
+        return await self._dispatch(
+            "content_rewrite", notebook_id, user_id,
+            run_input={"original_content": original_content},
             metadata={
                 "notebook_id": str(notebook_id),
                 "user_id": user_id,
                 "file_id": file_id
             },
-            on_completion="keep",
+            graph_id=graph_id,
         )
 
-        return {"status": "started"}
-
     async def generate_tasks(
             self,
             notebook_id: str,
             user_id: str,
             file_content: str,
             file_id: str,
-            graph_id: str = "task_generation_graph"
+            graph_id: Optional[str] = None
     ):
         """
         Initiates a LangGraph run to generate tasks from file content.
         """
-        notebook_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-            notebook_id=notebook_id,
-            model_type="light",
-            user_id=user_id
-        )
-
-        if not notebook_model:
-            raise ValueError(f"No notebook model found for: {notebook_id}")
-
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
-
-        if not model_api:
-            raise ValueError("API key is required.")
-
-        run_input = {
-            "light_model": notebook_model.model.name,
-            "api_key": model_api.value,
-            "text_input": file_content,
-        }
-
-        assistant_id = await self._get_assistant_id(graph_id)
-
-        background_run = await self.langgraph_client.runs.create(
-            thread_id=None,
-            assistant_id=assistant_id,
-            input=run_input,
-            webhook=LANGGRAPH_WEBHOOK_URL + "/task-generation-hook",
+        return await self._dispatch(
+            "task_generation", notebook_id, user_id,
+            run_input={"text_input": file_content},
             metadata={
                 "notebook_id": str(notebook_id),
                 "user_id": user_id,
                 "file_id": file_id
             },
-            on_completion="keep",
+            graph_id=graph_id,
         )
-
-        return {"status": "started"}
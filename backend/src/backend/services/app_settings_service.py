@@ -12,32 +12,36 @@ class AppSettingsService:
         self.session = session
         self.repo = app_settings_repository
 
-    async def create_setting(self, key: str, value: str) -> AppSettings:
+    # Write methods commit by default; orchestrating services pass auto_commit=False
+    # to batch several writes into their own single commit. Settings have no
+    # server-generated columns and sessions don't expire objects on commit, so
+    # the written object is returned without a refresh SELECT.
+
+    async def create_setting(self, key: str, value: str, auto_commit: bool = True) -> AppSettings:
         """Creates an app setting and commits the transaction."""
         app_setting = await self.repo.create(key=key, value=value)
-        await self.session.commit()
-        await self.session.refresh(app_setting)
+        if auto_commit:
+            await self.session.commit()
         return app_setting
 
-    async def update_setting(self, key: str, value: str) -> Optional[AppSettings]:
+    async def update_setting(self, key: str, value: str, auto_commit: bool = True) -> Optional[AppSettings]:
         """Updates an app setting and commits the transaction."""
         app_setting = await self.repo.update(key, value)
-        if app_setting:
+        if app_setting and auto_commit:
             await self.session.commit()
-            await self.session.refresh(app_setting)
         return app_setting
 
-    async def update_or_create_setting(self, key: str, value: str) -> AppSettings:
+    async def update_or_create_setting(self, key: str, value: str, auto_commit: bool = True) -> AppSettings:
         """Updates an existing setting or creates a new one and commits the transaction."""
         app_setting = await self.repo.update_or_create(key, value)
-        await self.session.commit()
-        await self.session.refresh(app_setting)
+        if auto_commit:
+            await self.session.commit()
         return app_setting
 
-    async def delete_setting(self, key: str) -> bool:
+    async def delete_setting(self, key: str, auto_commit: bool = True) -> bool:
         """Deletes an app setting and commits the transaction."""
         was_deleted = await self.repo.delete_by_key(key)
-        if was_deleted:
+        if was_deleted and auto_commit:
             await self.session.commit()
         return was_deleted
 
@@ -23,47 +23,66 @@ class ChatModelService:
         self.repo = chat_model_repository
         self.generative_model_service = generative_model_service
 
-    async def create_ai_model(self, user_id: str, chat_id: str, generative_model_id: str) -> ChatModel:
+    # Write methods commit by default; orchestrating services pass auto_commit=False
+    # to batch several writes into their own single commit. Sessions don't expire
+    # objects on commit and every column is set client-side, so the written object
+    # is returned as is, without a refresh SELECT.
+
+    async def create_ai_model(self, user_id: str, chat_id: str, generative_model_id: str,
+                              auto_commit: bool = True) -> ChatModel:
         """Creates a chat model and commits the transaction."""
         chat_model = await self.repo.create(
             user_id=user_id,
             chat_id=chat_id,
             generative_model_id=generative_model_id
         )
-        await self.session.commit()
-        await self.session.refresh(chat_model)
+        if auto_commit:
+            await self.session.commit()
         return chat_model
 
-    async def update_chat_model_with_generative_model(self, chat_model_id: str, model_update: ChatModelUpdate) -> Optional[ChatModel]:
+    async def create_ai_models_bulk(self, rows: List[Dict[str, Any]], auto_commit: bool = True) -> List[ChatModel]:
+        """Creates several chat models in one INSERT and commits the transaction."""
+        chat_models = await self.repo.bulk_create(rows)
+        if chat_models and auto_commit:
+            await self.session.commit()
+        return chat_models
+
+    async def update_chat_model_with_generative_model(self, chat_model_id: str, model_update: ChatModelUpdate,
+                                                      auto_commit: bool = True) -> Optional[ChatModel]:
         """Updates a chat model and commits the transaction."""
         gen_model = await self.generative_model_service.get_model(model_update.generative_model_name,
                                                                   model_update.generative_model_type)
         update_data = {"generative_model_id": gen_model.id}
         chat_model = await self.repo.update(chat_model_id, update_data)
         if chat_model:
-            await self.session.commit()
-            await self.session.refresh(chat_model)
+            # Keep the loaded relationship in step with the new foreign key
+            chat_model.model = gen_model
+            if auto_commit:
+                await self.session.commit()
         return chat_model
 
-    async def update_chat_model(self, chat_model_id: str, update_data: Dict[str, Any]) -> Optional[ChatModel]:
+    async def update_chat_model(self, chat_model_id: str, update_data: Dict[str, Any],
+                                auto_commit: bool = True) -> Optional[ChatModel]:
         """Updates a chat model and commits the transaction."""
         chat_model = await self.repo.update(chat_model_id, update_data)
         if chat_model:
-            await self.session.commit()
-            await self.session.refresh(chat_model)
+            if "generative_model_id" in update_data:
+                self.session.expire(chat_model, ["model"])
+            if auto_commit:
+                await self.session.commit()
         return chat_model
 
-    async def delete_chat_model(self, chat_model_id: str) -> bool:
+    async def delete_chat_model(self, chat_model_id: str, auto_commit: bool = True) -> bool:
         """Deletes a chat model and commits the transaction."""
         was_deleted = await self.repo.delete_by_id(chat_model_id)
-        if was_deleted:
+        if was_deleted and auto_commit:
             await self.session.commit()
         return was_deleted
 
-    async def delete_chat_model_by_chat_id(self, chat_id: str) -> bool:
+    async def delete_chat_model_by_chat_id(self, chat_id: str, auto_commit: bool = True) -> bool:
         """Deletes a chat model by chat_id and commits the transaction."""
         was_deleted = await self.repo.delete_by_chat_id(chat_id)
-        if was_deleted:
+        if was_deleted and auto_commit:
             await self.session.commit()
         return was_deleted
 
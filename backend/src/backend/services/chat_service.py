@@ -1,10 +1,12 @@
+import asyncio
+import logging
 import os
-from datetime import datetime, timezone
-from typing import List, Optional
+import uuid
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 
 from dotenv import load_dotenv
-from langgraph_sdk import get_client
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.models.chat import Chat
 from backend.models.dtos.chat import SendMessageRequest, CreateThreadRequest
@@ -13,16 +15,27 @@ from backend.repositories.notebook_repository import NotebookRepository
 from backend.services.ai_service import AIService
 from backend.services.assistant_service import AssistantService
 from backend.services.file_service import FileService
-from backend.services.model_api_service import ModelApiService
+from backend.services.langgraph_client import get_langgraph_client
+from backend.services.model_api_service import ModelApiService, read_encrypted_api_key
 from backend.services.notebook_model_service import NotebookModelService
+from backend.services.notebook_touches import mark_notebook_touched
 from backend.services.chat_model_service import ChatModelService
 from backend.repositories.chat_repository import ChatRepository
 from backend.repositories.thread_repository import ThreadRepository
 
 load_dotenv()
-LANGGRAPH_URL = os.getenv("LANGGRAPH_URL")
 webhook_url = os.getenv("LANGGRAPH_WEBHOOK_URL") + "/chat-response"
 
+logger = logging.getLogger(__name__)
+
+# LangGraph graph serving each chat mode
+_GRAPH_ID_MAP: Mapping[str, str] = MappingProxyType({
+    "brainstorm": "brainstorm_graph",
+    "consult": "chat_agent",
+    "analyser": "pros_cons_graph",
+    "questioner": "questioner_graph"
+})
+
 
 class ChatService:
     """
@@ -44,7 +57,8 @@ class ChatService:
             chat_model_service: ChatModelService,
             assistant_service: AssistantService,
             file_service: FileService,
-            ai_service: AIService
+            ai_service: AIService,
+            session_factory: Optional[async_sessionmaker[AsyncSession]] = None
     ):
         """
         Initializes the ChatService with all its dependencies.
@@ -59,6 +73,8 @@ class ChatService:
             assistant_service (AssistantService): Service for managing assistants.
             file_service (FileService): Service for handling file operations.
             ai_service (AIService): Service for AI-related tasks.
+            session_factory (async_sessionmaker): Opens short-lived sessions for reads
+                that run alongside the request session's work.
         """
         self.session = session
         self.chat_repo = chat_repository
@@ -68,14 +84,14 @@ class ChatService:
         self.notebook_model_service = notebook_model_service
         self.chat_model_service = chat_model_service
         self.assistant_service = assistant_service
-        self.langgraph_client = get_client(url=LANGGRAPH_URL)
+        self.langgraph_client = get_langgraph_client()
         self.file_service = file_service
-        self._assistant_ids = {}  # Cache for assistant IDs by mode
         self.ai_service = ai_service
+        self.session_factory = session_factory
 
     async def _get_assistant_id(self, mode: str) -> str:
         """
-        Lazy loads the assistant ID for a given mode and returns it as a string.
+        Returns the assistant ID for a given mode as a string.
 
         Args:
             mode (str): The mode of operation, e.g., "brainstorm" or "consult".
@@ -86,32 +102,13 @@ class ChatService:
         Raises:
             ValueError: If the mode is invalid or the corresponding assistant is not found.
         """
-        graph_id_map = {
-            "brainstorm": "brainstorm_graph",
-            "consult": "chat_agent",
-            "analyser" : "pros_cons_graph",
-            "questioner": "questioner_graph"
-        }
-
-        graph_id = graph_id_map.get(mode)
+        graph_id = _GRAPH_ID_MAP.get(mode)
         if not graph_id:
-            raise ValueError(f"Invalid mode specified: '{mode}'. Valid modes are: {list(graph_id_map.keys())}")
-
-        # Check cache first
-        if self._assistant_ids.get(mode) is None:
-            print(f"DEBUG: Fetching assistant for mode '{mode}' with graph_id '{graph_id}'...")
-            assistant = await self.assistant_service.get_assistant_by_graph_id(graph_id)
-            print(f"DEBUG: Got assistant: {assistant}")
+            raise ValueError(f"Invalid mode specified: '{mode}'. Valid modes are: {list(_GRAPH_ID_MAP.keys())}")
 
-            if assistant is None:
-                raise ValueError(f"Assistant with graph_id '{graph_id}' not found for mode '{mode}'.")
-
-            assistant_id_str = str(assistant.assistant_id)
-            print(f"DEBUG: Assistant ID: {assistant_id_str}")
-            self._assistant_ids[mode] = assistant_id_str
-            print(f"DEBUG: Stored assistant_id for mode '{mode}': {self._assistant_ids[mode]}")
-
-        return self._assistant_ids[mode]
+        # Shared with AIService: a process-wide cache, with one lock per graph_id
+        # so concurrent first requests for a graph only look it up once
+        return await self.ai_service.get_assistant_id(graph_id)
 
     # --- LangGraph Methods (External API Interaction) ---
 
@@ -121,13 +118,13 @@ class ChatService:
         return thread_state.get('values', {}).get('messages', [])
 
     async def delete_message_from_thread(self, thread_id: str, message_id_to_delete: str):
-        """Deletes a message from a thread in LangGraph by replacing the state."""
-        current_state = await self.langgraph_client.threads.get_state(thread_id=thread_id)
-        current_messages = current_state.get('values', {}).get('messages', [])
-        new_messages_list = [msg for msg in current_messages if msg.get('id') != message_id_to_delete]
+        """
+        Deletes a message from a thread in LangGraph. The graphs' messages reducer
+        drops it server-side, so the thread state is neither fetched nor sent back.
+        """
         await self.langgraph_client.threads.update_state(
             thread_id=thread_id,
-            values={"messages": {"$replace": new_messages_list}}
+            values={"messages": {"$remove": [message_id_to_delete]}}
         )
 
     async def create_new_chat_and_thread(
@@ -136,8 +133,19 @@ class ChatService:
         """
         Orchestrates creating a chat, its thread, and default models in a single transaction.
         """
-        # 1. Interact with external LangGraph API to create a thread
-        thread = await self.langgraph_client.threads.create()
+        # 1. Create the thread in LangGraph; the request runs while the notebook's
+        # models are looked up locally, as neither depends on the other
+        thread_task = asyncio.create_task(self.langgraph_client.threads.create())
+        try:
+            notebook_models = None
+            if request.notebook_id:
+                notebook_models = await self.notebook_model_service.get_notebook_models_by_id_and_types(
+                    user_id=user_id, notebook_id=request.notebook_id, model_types=["light", "heavy"]
+                )
+            thread = await thread_task
+        except BaseException:
+            thread_task.cancel()
+            raise
         thread_id = thread['thread_id']
 
         # Determine initial title
@@ -154,12 +162,9 @@ class ChatService:
             web_search=request.web_search
         )
 
-        # 2. Update Notebook Timestamp
+        # 2. Update Notebook Timestamp (written with the next batch of bumps)
         if request.notebook_id:
-            await self.notebook_repo.update(
-                str(request.notebook_id),
-                {"updated_at": datetime.now(timezone.utc)}
-            )
+            mark_notebook_touched(request.notebook_id)
 
         # 3. Generate Chat Name (Only if text is provided)
         # If it's an audio start, we skip this to avoid errors with empty text inputs.
@@ -176,74 +181,66 @@ class ChatService:
                     )
                 )
             except Exception as e:
-                print(f"Error generating chat name: {e}")
-
-        await self.session.flush()
-
-        # Track created models for potential later refresh
-        created_models = []
-
-        # 4. Get notebook models if notebook_id is provided
-        if request.notebook_id:
-            notebook_light_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-                notebook_id=request.notebook_id, model_type="light", user_id=user_id
+                logger.warning("Error generating chat name: %s", e)
+
+        # 4. Create chat models based on the notebook models, in one INSERT
+        if notebook_models:
+            await self.chat_model_service.create_ai_models_bulk(
+                [
+                    {
+                        "user_id": user_id,
+                        "chat_id": new_chat.chat_id,
+                        "generative_model_id": notebook_model.generative_model_id,
+                    }
+                    for notebook_model in (notebook_models["light"], notebook_models["heavy"])
+                    if notebook_model
+                ],
+                auto_commit=False
             )
-            notebook_heavy_model = await self.notebook_model_service.get_notebook_model_by_id_and_type(
-                notebook_id=request.notebook_id, model_type="heavy", user_id=user_id
-            )
-
-            # 5. Create chat models based on notebook models
-            if notebook_light_model:
-                await self.chat_model_service.create_ai_model(
-                    user_id=user_id,
-                    chat_id=new_chat.chat_id,
-                    generative_model_id=str(notebook_light_model.generative_model_id)
-                )
-
-            if notebook_heavy_model:
-                await self.chat_model_service.create_ai_model(
-                    user_id=user_id,
-                    chat_id=new_chat.chat_id,
-                    generative_model_id=str(notebook_heavy_model.generative_model_id)
-                )
 
-        # 6. Single commit for everything
+        # 5. Single commit for everything. Every column the caller reads (ids,
+        # created_at, web_search) was set client-side and survives the commit
+        # (expire_on_commit=False), so no refresh SELECT is needed.
         await self.session.commit()
 
-        # 7. Refresh the main chat object
-        await self.session.refresh(new_chat)
-
         return new_chat
 
-    async def send_message_to_graph(self, thread_id: str, user_id: str, request: SendMessageRequest):
+    async def send_message_to_graph(self, thread_id: uuid.UUID, user_id: str, request: SendMessageRequest):
         """
         Orchestrates sending a message by gathering all data and invoking LangGraph.
         """
-        chat_obj = await self.chat_repo.get_by_thread_id(thread_id=thread_id)
+        chat_obj = await self.chat_repo.get_send_context_by_thread_id(thread_id=thread_id)
         if not chat_obj:
             raise ValueError(f"No chat found for thread_id: {thread_id}")
 
+        models_dict = chat_obj.models
+
         # --- Update Notebook Timestamp (Send Message) ---
+        # Bumps are coalesced and written every few seconds, not per message
         if chat_obj.notebook_id:
-            await self.notebook_repo.update(
-                str(chat_obj.notebook_id),
-                {"updated_at": datetime.now(timezone.utc)}
-            )
-            # Commit the timestamp update immediately so it persists even if the LangGraph run takes time
-            await self.session.commit()
+            mark_notebook_touched(chat_obj.notebook_id)
 
-        models_dict = {chat_model.model.type: chat_model.model.name for chat_model in chat_obj.models}
-        model_api = await self.model_api_service.get_api_key_by_user_id(user_id)
+        if self.session_factory is None:
+            api_key = await self.model_api_service.get_encrypted_api_key_value(user_id)
+        else:
+            api_key = await read_encrypted_api_key(user_id, self.session_factory)
 
         # Require API key for all chat operations
-        if not model_api:
+        if not api_key:
             raise ValueError("API key is required to use this application. Please set up your API key in the settings.")
 
+        # Optional inputs are only sent when set
+        optional_input = {
+            "text_input": request.message,
+            "audio_path": request.audio_path,
+            "sub_mode": request.sub_mode,
+        }
         run_input = {
             "light_model": models_dict.get("light"),
             "heavy_model": models_dict.get("heavy"),
-            "api_key": model_api.value,
+            "api_key": api_key,
             "web_search": chat_obj.web_search,
+            **{key: value for key, value in optional_input.items() if value},
         }
 
         # if not chat_obj.started:
@@ -251,23 +248,22 @@ class ChatService:
         #     run_input["files_contents"] = files_contents
         #     chat_obj.started = True
 
-        if request.message:
-            run_input["text_input"] = request.message
-        if request.audio_path:
-            run_input["audio_path"] = request.audio_path
-        if request.sub_mode:
-            run_input["sub_mode"] = request.sub_mode
-
         assistant_id = await self._get_assistant_id(request.mode.lower())
 
-        metadata = {"user_id": user_id, "mode": request.mode, "notebook_id": str(chat_obj.notebook_id),}
-        if request.sub_mode:
-            metadata["sub_mode"] = request.sub_mode
-        if request.generation_context:
-            metadata["generation_context"] = request.generation_context
+        metadata = {
+            "user_id": user_id,
+            "mode": request.mode,
+            "notebook_id": str(chat_obj.notebook_id),
+            **({"sub_mode": request.sub_mode} if request.sub_mode else {}),
+            **({"generation_context": request.generation_context} if request.generation_context else {}),
+        }
+
+        # End the read transaction before the LangGraph call, so its pooled
+        # connection is not held across it
+        await self.session.commit()
 
         background_run = await self.langgraph_client.runs.create(
-            thread_id=thread_id,
+            thread_id=str(thread_id),
             assistant_id=assistant_id,
             input=run_input,
             webhook=webhook_url,
@@ -278,7 +274,7 @@ class ChatService:
         """Gets all chats for a user by calling the repository."""
         return await self.chat_repo.list_by_user_id(user_id, notebook_id)
 
-    async def get_chat_by_id(self, chat_id: str) -> Optional[Chat]:
+    async def get_chat_by_id(self, chat_id: uuid.UUID) -> Optional[Chat]:
         """Gets a chat by its ID by calling the repository."""
         return await self.chat_repo.get_by_id(chat_id)
 
@@ -288,7 +284,14 @@ class ChatService:
         await self.session.commit()
         return updated_chat
 
-    async def delete_chat(self, chat_id: str) -> bool:
+    async def update_chat_title(self, chat_id: uuid.UUID, title: str) -> Optional[Chat]:
+        """Sets a chat's title in one UPDATE ... RETURNING and commits. Returns None if not found."""
+        updated_chat = await self.chat_repo.update_by_id(chat_id, {"title": title})
+        if updated_chat:
+            await self.session.commit()
+        return updated_chat
+
+    async def delete_chat(self, chat_id: uuid.UUID) -> bool:
         """
         Deletes a chat from the database in a transaction.
         Note: This could be expanded to also delete the thread from LangGraph.
@@ -298,23 +301,20 @@ class ChatService:
             await self.session.commit()
         return was_deleted
 
-    async def toggle_web_search(self, chat_id: str, enabled: bool) -> Optional[Chat]:
+    async def toggle_web_search(self, chat_id: uuid.UUID, enabled: bool) -> Optional[Chat]:
         """
         Enables or disables the web search feature for a specific chat.
 
         Args:
-            chat_id (str): The ID of the chat to update.
+            chat_id (uuid.UUID): The ID of the chat to update.
             enabled (bool): The new status for web search (True for enabled, False for disabled).
 
         Returns:
             The updated Chat object if found, otherwise None.
         """
-        chat_obj = await self.chat_repo.get_by_id(chat_id)
-        if not chat_obj:
+        updated_chat = await self.chat_repo.update_by_id(chat_id, {"web_search": enabled})
+        if not updated_chat:
             return None  # The controller will handle the 404 response
 
-        chat_obj.web_search = enabled
-        updated_chat = await self.chat_repo.update(chat_obj)
         await self.session.commit()
-        await self.session.refresh(updated_chat)
         return updated_chat
@@ -1,5 +1,24 @@
+import time
+from typing import Dict, Tuple
+
 from cryptography.fernet import Fernet
 
+# Decrypted values by Fernet token, as (cached_at, value), oldest first. A token
+# always decrypts to the same value, so the TTL only bounds how long plaintext
+# stays in memory.
+DECRYPTED_CACHE_TTL_SECONDS = 60.0
+DECRYPTED_CACHE_MAX_SIZE = 1024
+_decrypted: Dict[str, Tuple[float, str]] = {}
+
+
+def _evict_expired(now: float) -> None:
+    """Drops expired plaintexts; entries are kept oldest first, so it stops at the first live one."""
+    while _decrypted:
+        oldest = next(iter(_decrypted))
+        if now - _decrypted[oldest][0] < DECRYPTED_CACHE_TTL_SECONDS:
+            break
+        del _decrypted[oldest]
+
 
 class FernetService:
     fernet: Fernet
@@ -12,5 +31,15 @@ class FernetService:
         return encrypted_bytes.decode('utf-8')
 
     def decrypt_data(self, data: str) -> str:
-        encrypted_bytes = data.encode('utf-8')
-        return self.fernet.decrypt(encrypted_bytes).decode('utf-8')
\ No newline at end of file
+        now = time.monotonic()
+        _evict_expired(now)
+        cached = _decrypted.get(data)
+        if cached is not None:
+            return cached[1]
+
+        # Fernet accepts the token as str, so it is not encoded first
+        value = self.fernet.decrypt(data).decode('utf-8')
+        if len(_decrypted) >= DECRYPTED_CACHE_MAX_SIZE:
+            del _decrypted[next(iter(_decrypted))]
+        _decrypted[data] = (now, value)
+        return value
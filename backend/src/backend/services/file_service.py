@@ -4,11 +4,13 @@ import os
 import uuid
 import time
 import asyncio
+import logging
 import shutil
 import tempfile
 import subprocess
-from typing import List, Optional, Dict, Any, BinaryIO, Tuple
+from typing import List, Optional, Dict, Any, BinaryIO, Set, Tuple
 
+from boto3.s3.transfer import TransferConfig
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +23,42 @@ load_dotenv()
 S3_ENDPOINT = os.getenv("S3_ENDPOINT_URL", "http://seaweedfs:8333")
 BUCKET_NAME = os.getenv("BUCKET_NAME", "my-local-bucket")
 
+logger = logging.getLogger(__name__)
+
+# Multipart settings for uploads: files above 8 MB are sent in 8 MB parts, up to
+# 8 at a time on boto3's own transfer threads, so a large upload doesn't take
+# most of the shared S3 client's 32 pooled connections.
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+# Buckets known to exist. Checked once per process (at startup, or on the first
+# upload if S3 was unreachable then) instead of with a HEAD request per upload.
+_ready_buckets: Set[str] = set()
+
+
+def ensure_bucket(s3_client, bucket: str = BUCKET_NAME) -> bool:
+    """
+    Creates the bucket if it does not exist yet. Blocking (boto3); a no-op once
+    the bucket is known to exist. Returns whether it is.
+    """
+    if bucket in _ready_buckets:
+        return True
+    try:
+        s3_client.head_bucket(Bucket=bucket)
+    except Exception:
+        try:
+            s3_client.create_bucket(Bucket=bucket)
+        except Exception:
+            # Checked again on the next upload
+            logger.exception("Failed to create S3 bucket %s (it might already exist)", bucket)
+            return False
+    _ready_buckets.add(bucket)
+    return True
+
 
 class FileService:
     """
@@ -128,17 +166,12 @@ class FileService:
             raise ValueError("S3 Client not configured")
 
         def _upload_sync():
-            # 1. Ensure bucket exists (idempotent-ish)
-            try:
-                self.s3_client.head_bucket(Bucket=BUCKET_NAME)
-            except Exception:
-                try:
-                    self.s3_client.create_bucket(Bucket=BUCKET_NAME)
-                except Exception as e:
-                    print(f"Error creating bucket (might already exist): {e}")
+            # 1. Ensure bucket exists (only checked until it is known to)
+            ensure_bucket(self.s3_client)
 
             # 2. Upload file
-            # Note: upload_fileobj automatically handles multipart uploads for large files
+            # Note: upload_fileobj handles multipart uploads for large files, with parts
+            # sent in parallel on its own threads (see S3_TRANSFER_CONFIG)
             if hasattr(file_obj, 'seek'):
                 file_obj.seek(0)
 
@@ -146,7 +179,8 @@ class FileService:
                 file_obj,
                 BUCKET_NAME,
                 object_name,
-                ExtraArgs={'ContentType': content_type}
+                ExtraArgs={'ContentType': content_type},
+                Config=S3_TRANSFER_CONFIG
             )
 
         # Run synchronous boto3 code in a separate thread to not block the async event loop
@@ -280,12 +314,23 @@ class FileService:
         if not files:
             return ""
 
+        # Text files are downloaded from S3 concurrently; the results are
+        # assembled below in the files' original order
+        text_files = [f for f in files if f.content_type and f.content_type.startswith('text/')]
+        text_contents = await asyncio.gather(
+            *(self.get_text_content_from_s3(f.unique_filename) for f in text_files),
+            return_exceptions=True
+        )
+        text_by_file_id = {f.id: text for f, text in zip(text_files, text_contents)}
+
         content_parts = []
         for file in files:
             try:
-                # Text files: fetch content from S3
-                if file.content_type and file.content_type.startswith('text/'):
-                    text_content = await self.get_text_content_from_s3(file.unique_filename)
+                # Text files: content fetched from S3 above
+                if file.id in text_by_file_id:
+                    text_content = text_by_file_id[file.id]
+                    if isinstance(text_content, BaseException):
+                        raise text_content
                     if text_content:
                         content_parts.append(f"--- File: {file.filename} ---\n{text_content}")
 
@@ -300,4 +345,4 @@ class FileService:
                 print(f"Error processing file {file.filename} for notebook context: {str(e)}")
                 continue
 
-        return "\n\n".join(content_parts)
\ No newline at end of file
+        return "\n\n".join(content_parts)
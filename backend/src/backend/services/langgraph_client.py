@@ -0,0 +1,154 @@
+# backend/services/langgraph_client.py
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+import langgraph_sdk
+from dotenv import load_dotenv
+from langgraph_sdk.client import LangGraphClient
+from langgraph_sdk.schema import Run
+
+load_dotenv()
+LANGGRAPH_URL = os.getenv("LANGGRAPH_URL")
+
+# httpx keeps only 20 idle connections for 5s by default, so bursts of runs.create
+# calls keep reconnecting. Keep as many idle connections as may be open, for longer.
+LANGGRAPH_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=60)
+
+# Stateless background runs submitted within this window are created together
+# with one POST /runs/batch, instead of one request per run.
+RUN_BATCH_WINDOW_SECONDS = 0.01
+RUN_BATCH_MAX_SIZE = 50
+
+# One LangGraph client (and so one httpx keep-alive pool) per process, created on
+# first use. Services are built per request and would otherwise open a new pool,
+# and new connections, for every LangGraph call they make.
+_client: Optional[LangGraphClient] = None
+
+
+def _langgraph_headers() -> Dict[str, str]:
+    """The headers get_client would send: the SDK user agent and, if set, the API key."""
+    headers = {"User-Agent": f"langgraph-sdk-py/{langgraph_sdk.__version__}"}
+    for prefix in ("LANGGRAPH", "LANGSMITH", "LANGCHAIN"):
+        if api_key := os.getenv(f"{prefix}_API_KEY"):
+            headers["x-api-key"] = api_key.strip().strip('"').strip("'")
+            break
+    return headers
+
+
+def get_langgraph_client() -> LangGraphClient:
+    """Returns the process-wide LangGraph client."""
+    global _client
+    if _client is None:
+        # Built like get_client does, with the pool limits applied to the transport
+        _client = LangGraphClient(httpx.AsyncClient(
+            base_url=LANGGRAPH_URL or "http://localhost:8123",
+            headers=_langgraph_headers(),
+            timeout=httpx.Timeout(connect=5, read=300, write=300, pool=5),
+            transport=httpx.AsyncHTTPTransport(retries=5, limits=LANGGRAPH_POOL_LIMITS),
+        ))
+    return _client
+
+
+async def close_langgraph_client() -> None:
+    """Closes the shared client's connection pool; called at application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.http.client.aclose()
+        _client = None
+
+
+# Stateless run payloads waiting for the current batch window, with the future
+# each submitter awaits, and the batch requests in flight.
+_pending_runs: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+_batch_flush: Optional[asyncio.TimerHandle] = None
+_batches_in_flight: Set[asyncio.Task] = set()
+
+
+async def create_stateless_run(payload: Dict[str, Any]) -> Run:
+    """
+    Creates a stateless background run (no thread_id), batched with the other
+    runs submitted within RUN_BATCH_WINDOW_SECONDS. Takes the keyword arguments
+    of runs.create as a dict; returns the created run.
+    """
+    global _batch_flush
+    future = asyncio.get_running_loop().create_future()
+    _pending_runs.append((payload, future))
+    if len(_pending_runs) >= RUN_BATCH_MAX_SIZE:
+        _flush_pending_runs()
+    elif _batch_flush is None:
+        _batch_flush = asyncio.get_running_loop().call_later(RUN_BATCH_WINDOW_SECONDS, _flush_pending_runs)
+    return await future
+
+
+def _flush_pending_runs() -> None:
+    global _batch_flush
+    if _batch_flush is not None:
+        _batch_flush.cancel()
+        _batch_flush = None
+    batch = _pending_runs[:]
+    _pending_runs.clear()
+    if batch:
+        task = asyncio.create_task(_create_batch(batch))
+        _batches_in_flight.add(task)
+        task.add_done_callback(_batches_in_flight.discard)
+
+
+async def drain_stateless_runs() -> None:
+    """
+    Sends the runs still waiting for the batch window and waits for every batch
+    in flight. Called at application shutdown, before close_langgraph_client,
+    so runs already reported as started are not dropped.
+    """
+    _flush_pending_runs()
+    if _batches_in_flight:
+        await asyncio.gather(*_batches_in_flight, return_exceptions=True)
+
+
+def _settle(future: asyncio.Future, result: Any) -> None:
+    if future.done():
+        return
+    if isinstance(result, asyncio.CancelledError):
+        future.cancel()
+    elif isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+
+async def _create_batch(batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+    client = get_langgraph_client()
+    try:
+        if len(batch) == 1:
+            runs = [await client.runs.create(thread_id=None, **batch[0][0])]
+        else:
+            runs = await client.runs.create_batch([payload for payload, _ in batch])
+    except httpx.HTTPStatusError as e:
+        if len(batch) == 1 or not 400 <= e.response.status_code < 500:
+            for _, future in batch:
+                _settle(future, e)
+            return
+        # The batch was rejected as a whole (e.g. one stale assistant_id), so none
+        # of its runs exist: create them one by one, so only the bad payload fails
+        results = await asyncio.gather(
+            *(client.runs.create(thread_id=None, **payload) for payload, _ in batch),
+            return_exceptions=True,
+        )
+        for (_, future), result in zip(batch, results):
+            _settle(future, result)
+        return
+    except Exception as e:
+        # Not retried one by one: the server may have created some of the runs
+        for _, future in batch:
+            _settle(future, e)
+        return
+
+    # /runs/batch returns the runs in the order of the payloads
+    for (_, future), run in zip(batch, runs):
+        _settle(future, run)
+
+    # Submitters left without a run would otherwise wait forever
+    for _, future in batch[len(runs):]:
+        _settle(future, RuntimeError(f"LangGraph created {len(runs)} of {len(batch)} batched runs"))
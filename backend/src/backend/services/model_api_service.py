@@ -1,11 +1,57 @@
 # backend/services/model_api_service.py
 
-from typing import Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+import time
+from typing import Dict, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from backend.models.model_api import ModelApi
 from .fernet_service import FernetService
 from ..repositories.model_api_repository import ModelApiRepository
 
+# Encrypted API key values by user_id, as (cached_at, value). Read on every AI
+# dispatch, so kept in memory briefly; the TTL bounds staleness across workers,
+# and this process drops an entry as soon as the key is changed or deleted.
+API_KEY_CACHE_TTL_SECONDS = 60.0
+_encrypted_api_keys: Dict[str, Tuple[float, str]] = {}
+
+
+def get_cached_api_key(user_id: str) -> Optional[str]:
+    """Returns the cached encrypted API key for a user, or None if absent or expired."""
+    cached = _encrypted_api_keys.get(user_id)
+    if cached is None:
+        return None
+    cached_at, value = cached
+    if time.monotonic() - cached_at >= API_KEY_CACHE_TTL_SECONDS:
+        _encrypted_api_keys.pop(user_id, None)
+        return None
+    return value
+
+
+def cache_api_key(user_id: str, encrypted_value: str) -> None:
+    _encrypted_api_keys[user_id] = (time.monotonic(), encrypted_value)
+
+
+def invalidate_api_key(user_id: str) -> None:
+    _encrypted_api_keys.pop(user_id, None)
+
+
+async def read_encrypted_api_key(user_id: str, session_factory: async_sessionmaker[AsyncSession]) -> Optional[str]:
+    """
+    Returns the user's encrypted API key value from the key cache, or reads it
+    on its own short-lived session, so it can run alongside work on the
+    request session.
+    """
+    value = get_cached_api_key(user_id)
+    if value is not None:
+        return value
+
+    async with session_factory() as session:
+        model_api = await ModelApiRepository(session).get_by_user_id(user_id)
+
+    if model_api is None or not model_api.value:
+        return None
+    cache_api_key(user_id, model_api.value)
+    return model_api.value
+
 
 class ModelApiService:
     """
@@ -36,6 +82,7 @@ class ModelApiService:
         # Control the transaction
         await self.session.commit()
         await self.session.refresh(model_api)
+        invalidate_api_key(user_id)
 
         return model_api
 
@@ -45,6 +92,21 @@ class ModelApiService:
         """
         return await self.repo.get_by_user_id(user_id)
 
+    async def get_encrypted_api_key_value(self, user_id: str) -> Optional[str]:
+        """
+        Returns the user's API key value (still encrypted), served from the
+        short-lived key cache when possible.
+        """
+        value = get_cached_api_key(user_id)
+        if value is not None:
+            return value
+
+        model_api = await self.repo.get_by_user_id(user_id)
+        if not model_api or not model_api.value:
+            return None
+        cache_api_key(user_id, model_api.value)
+        return model_api.value
+
     async def get_decrypted_api_key_value(self, user_id: str) -> Optional[str]:
         """
         Retrieves and decrypts the API key for a given user.
@@ -87,5 +149,6 @@ class ModelApiService:
 
         if was_deleted:
             await self.session.commit()
+            invalidate_api_key(user_id)
 
         return was_deleted
\ No newline at end of file
@@ -18,7 +18,7 @@ class NotebookModelService:
         session: AsyncSession,
         notebook_model_repository: NotebookModelRepository,
         app_settings_service: AppSettingsService,
-        generative_model_service: GenerativeModelService
+        generative_model_service: GenerativeModelService,
     ):
         self.session = session
         self.repo = notebook_model_repository
@@ -79,8 +79,23 @@ class NotebookModelService:
 
         return notebook_model
 
-    async def get_notebook_models_by_notebook_id(self, notebook_id: str) -> List[NotebookModel]:
-        return await self.repo.list_by_notebook_id(notebook_id)
+    async def get_notebook_models_by_id_and_types(
+        self, user_id: str, notebook_id: str, model_types: List[str]
+    ) -> Dict[str, NotebookModel]:
+        """
+        Gets the notebook's model of each type, keyed by type, with one query.
+        Missing types get their default model created, like get_notebook_model_by_id_and_type.
+        """
+        notebook_models = await self.repo.get_by_notebook_id_and_types(notebook_id, model_types)
+        for model_type in model_types:
+            if model_type not in notebook_models:
+                value = await self.app_settings_service.get_value(key=f"{model_type}_model")
+                notebook_models[model_type] = await self.create_notebook_model(
+                    notebook_id=notebook_id, model_name=value, model_type=model_type, user_id=user_id)
+        return notebook_models
+
+    async def get_notebook_models_by_notebook_id(self, notebook_id: str, include_model: bool = True) -> List[NotebookModel]:
+        return await self.repo.list_by_notebook_id(notebook_id, include_model=include_model)
 
     async def get_notebook_models_by_user_id(self, user_id: str) -> List[NotebookModel]:
         return await self.repo.list_by_user_id(user_id)
@@ -76,7 +76,8 @@ class NotebookService:
     # --- Read methods are simple pass-throughs to the repository ---
 
     async def get_notebook_by_id(self, notebook_id: str) -> Optional[Notebook]:
-        return await self.repo.get_by_id(notebook_id)
+        with self.session.no_autoflush:
+            return await self.repo.get_by_id(notebook_id)
 
     async def get_all_notebooks(self) -> List[Notebook]:
         return await self.repo.list_all()
@@ -94,4 +95,4 @@ class NotebookService:
         return await self.repo.list_chats_for_notebook(notebook_id)
 
     async def get_files_for_notebook(self, notebook_id: str) -> List[File]:
-        return await self.repo.list_files_for_notebook(notebook_id)
\ No newline at end of file
+        return await self.repo.list_files_for_notebook(notebook_id)
@@ -0,0 +1,59 @@
+# backend/services/notebook_touches.py
+
+import logging
+import uuid
+from typing import Set
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.repositories.notebook_repository import NotebookRepository
+
+logger = logging.getLogger(__name__)
+
+# Chat activity bumps the notebook's updated_at on every message. Instead of an
+# UPDATE and commit per message, bumps are collected here and written together
+# every few seconds by a scheduler job (see main.py) in one UPDATE, stamped with
+# the database's now() at flush time.
+NOTEBOOK_TOUCH_FLUSH_INTERVAL_SECONDS = 5
+
+# Ids of the notebooks bumped since the last flush
+_pending_touches: Set[str] = set()
+
+
+def mark_notebook_touched(notebook_id) -> None:
+    """
+    Records that the notebook was just active; written on the next flush.
+    An id that is not a UUID is skipped here, as it would fail every flush
+    and take the other pending bumps down with it.
+    """
+    try:
+        _pending_touches.add(str(uuid.UUID(str(notebook_id))))
+    except ValueError:
+        logger.warning("Ignoring touch of notebook with invalid id %r", notebook_id)
+
+
+async def flush_notebook_touches(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    """
+    Writes every pending bump in one UPDATE and commits it.
+    Returns the number of notebooks updated. Bumps that fail to write, or
+    whose write is cancelled, are put back for the next flush.
+    """
+    if not _pending_touches:
+        return 0
+
+    touches = set(_pending_touches)
+    _pending_touches.clear()
+    try:
+        async with session_factory() as session:
+            await NotebookRepository(session).touch_many(touches)
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to write %d notebook timestamps", len(touches))
+        _pending_touches.update(touches)
+        return 0
+    except BaseException:
+        # Cancelled mid-write (the scheduler cancels running jobs at shutdown):
+        # keep the bumps for the final flush
+        _pending_touches.update(touches)
+        raise
+    return len(touches)
@@ -21,8 +21,10 @@ class PropositionService:
     async def get_proposition_by_notebook_id(self, notebook_id: uuid.UUID) -> Optional[Proposition]:
         """
         Retrieves a single proposition by its associated notebook_id.
+        Read-only, so pending changes are not flushed first.
         """
-        return await self.repo.get_by_id(notebook_id)
+        with self.session.no_autoflush:
+            return await self.repo.get_by_id(notebook_id)
 
     async def create_or_update_proposition(
         self,
@@ -1,17 +1,21 @@
-from typing import List, Optional, Dict, Any
+import uuid
+from typing import AsyncIterator, List, Optional, Dict, Any, Union
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.models.task import Task, TaskStatus, TaskPriority
+from backend.models.task import Task, TaskListRow, TaskStatus, TaskPriority
 from backend.models.dtos.task_dtos import (
     TaskCreateRequest,
     TaskUpdateRequest,
     TaskMoveRequest,
     TaskReorderRequest,
     TaskSearchRequest,
-    TaskResponse
+    TaskResponse,
+    TaskStatusEnum,
+    TaskPriorityEnum
 )
-from backend.repositories.task_repository import TaskRepository
+from backend.repositories.notebook_repository import NotebookRepository
+from backend.repositories.task_repository import TaskRepository, encode_task_cursor
 
 
 class TaskService:
@@ -24,6 +28,19 @@ class TaskService:
         self.session = session
         self.repo = task_repository
 
+    @staticmethod
+    def next_page_cursor(
+        last_task: Optional[Union[Task, TaskListRow]],
+        page_size: int,
+        limit: int
+    ) -> Optional[str]:
+        """
+        Returns the cursor for the page ending at `last_task`, or None if this was the last page.
+        """
+        if last_task is None or page_size < limit:
+            return None
+        return encode_task_cursor(last_task)
+
     @staticmethod
     def validate_task_status(status: str) -> TaskStatus:
         """
@@ -84,12 +101,11 @@ class TaskService:
         due_date = self.validate_due_date(task_data.due_date) if task_data.due_date else None
 
         # Get the next position for this status in the notebook
-        existing_tasks = await self.repo.get_tasks_by_status_and_user(
+        position = await self.repo.count_by_user_and_filters(
             user_id=user_id,
             notebook_id=notebook_id,
             status=status
         )
-        position = len(existing_tasks)
 
         task_record = await self.repo.create(
             user_id=user_id,
@@ -108,6 +124,57 @@ class TaskService:
 
         return task_record
 
+    async def bulk_create_tasks(
+        self,
+        user_id: str,
+        notebook_id: str,
+        tasks_data: List[TaskCreateRequest]
+    ) -> Optional[List[str]]:
+        """
+        Create many tasks in a notebook in one round trip, e.g. when importing
+        a board or seeding a notebook from a template. New tasks are appended
+        to the end of their status column, in the given order.
+        The rows are written with COPY, which skips the ORM, so the notebook's
+        ownership is checked here first.
+        Returns the ids of the created tasks, or None if the notebook does not
+        exist or does not belong to the user.
+        """
+        try:
+            notebook_uuid = uuid.UUID(str(notebook_id))
+        except ValueError:
+            return None
+        notebook = await NotebookRepository(self.session).get_by_id(notebook_uuid)
+        if not notebook or notebook.user_id != user_id:
+            return None
+
+        # New tasks go after the existing ones in each status column
+        next_positions = await self.repo.get_status_counts(user_id=user_id, notebook_id=notebook_id)
+        rows = []
+        for task_data in tasks_data:
+            title = task_data.title.strip()
+            if not title:
+                raise ValueError("Task title cannot be empty")
+
+            status = self.validate_task_status(task_data.status.value) if task_data.status else TaskStatus.TODO
+
+            rows.append({
+                "user_id": user_id,
+                "notebook_id": notebook_id,
+                "title": title,
+                "description": task_data.description.strip() if task_data.description else None,
+                "status": status,
+                "priority": self.validate_task_priority(task_data.priority.value) if task_data.priority else TaskPriority.MEDIUM,
+                "tags": self.sanitize_tags(task_data.tags) if task_data.tags else [],
+                "due_date": self.validate_due_date(task_data.due_date) if task_data.due_date else None,
+                "position": next_positions[status]
+            })
+            next_positions[status] += 1
+
+        task_ids = await self.repo.bulk_create_tasks(rows)
+        await self.session.commit()
+
+        return [str(task_id) for task_id in task_ids]
+
     async def get_tasks_for_user(
         self,
         user_id: str,
@@ -116,9 +183,9 @@ class TaskService:
         priority: Optional[TaskPriority] = None,
         tags: Optional[List[str]] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         include_archived: bool = False
-    ) -> List[Task]:
+    ) -> List[TaskListRow]:
         """
         Retrieve tasks for a user with optional filtering.
         """
@@ -129,7 +196,7 @@ class TaskService:
             priority=priority,
             tags=tags,
             limit=limit,
-            offset=offset,
+            cursor=cursor,
             include_archived=include_archived
         )
 
@@ -209,15 +276,14 @@ class TaskService:
 
         new_status = self.validate_task_status(move_data.status.value)
 
-        # Get all tasks in the target column to determine position
-        target_tasks = await self.repo.get_tasks_by_status_and_user(
-            user_id=user_id,
-            notebook_id=str(existing_task.notebook_id),
-            status=new_status
-        )
-
-        # If no position specified, put at the end
-        new_position = move_data.position if move_data.position is not None else len(target_tasks)
+        # If no position specified, put at the end of the target column
+        new_position = move_data.position
+        if new_position is None:
+            new_position = await self.repo.count_by_user_and_filters(
+                user_id=user_id,
+                notebook_id=str(existing_task.notebook_id),
+                status=new_status
+            )
 
         updated_task = await self.repo.move_task(
             task_id=task_id,
@@ -322,15 +388,16 @@ class TaskService:
         user_id: str,
         search_data: TaskSearchRequest,
         notebook_id: Optional[str] = None
-    ) -> List[Task]:
+    ) -> AsyncIterator[Task]:
         """
         Search tasks with multiple filter criteria.
+        Returns a single-pass stream of the matching tasks.
         """
         # Convert enum values if provided
         status = self.validate_task_status(search_data.status.value) if search_data.status else None
         priority = self.validate_task_priority(search_data.priority.value) if search_data.priority else None
 
-        return await self.repo.search_tasks(
+        return self.repo.search_tasks(
             user_id=user_id,
             notebook_id=notebook_id,
             query=search_data.query,
@@ -340,7 +407,7 @@ class TaskService:
             has_due_date=search_data.has_due_date,
             is_overdue=search_data.is_overdue,
             limit=search_data.limit,
-            offset=search_data.offset
+            cursor=search_data.cursor
         )
 
     async def get_tasks_for_user_across_notebooks(
@@ -351,7 +418,7 @@ class TaskService:
         tags: Optional[List[str]] = None,
         notebook_id: Optional[str] = None,
         limit: int = 1000,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         include_archived: bool = False
     ) -> List[Task]:
         """
@@ -364,7 +431,7 @@ class TaskService:
             priority=priority,
             tags=tags,
             limit=limit,
-            offset=offset,
+            cursor=cursor,
             include_archived=include_archived
         )
 
@@ -376,33 +443,26 @@ class TaskService:
         """
         Get task statistics for a user/notebook.
         """
-        stats = {}
-        total = 0
-
-        for status in TaskStatus:
-            count = await self.repo.count_by_user_and_filters(
-                user_id=user_id,
-                notebook_id=notebook_id,
-                status=status
-            )
-            stats[status.value] = count
-            total += count
+        counts = await self.repo.get_status_counts(user_id=user_id, notebook_id=notebook_id)
 
-        stats['total'] = total
+        stats = {status.value: count for status, count in counts.items()}
+        stats['total'] = sum(counts.values())
         return stats
 
-    def task_to_response(self, task: Task) -> TaskResponse:
+    def task_to_response(self, task: Union[Task, TaskListRow]) -> TaskResponse:
         """
-        Convert a Task entity to TaskResponse DTO.
+        Convert a Task entity (or list row) to TaskResponse DTO.
+        Values come straight from the database, so the DTO is built with
+        model_construct to skip a redundant validation pass.
         """
-        return TaskResponse(
+        return TaskResponse.model_construct(
             id=task.id,
             user_id=task.user_id,
             notebook_id=task.notebook_id,
             title=task.title,
             description=task.description,
-            status=task.status,
-            priority=task.priority,
+            status=TaskStatusEnum(task.status),
+            priority=TaskPriorityEnum(task.priority),
             tags=task.tags or [],
             due_date=task.due_date.date() if task.due_date else None,
             position=task.position,
@@ -418,7 +478,6 @@ class TaskService:
         """
         Convert a Task entity to response dict including notebook information.
         """
-        from backend.repositories.notebook_repository import NotebookRepository
         notebook_repo = NotebookRepository(self.session)
 
         # Get notebook information
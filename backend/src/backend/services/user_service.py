@@ -37,7 +37,8 @@ class UserService:
 
     async def check_user_exist(self, user_id: uuid.UUID) -> bool:
         """Checks if a user exists based on their ID."""
-        user = await self.user_repo.get_by_id(user_id)
+        with self.session.no_autoflush:
+            user = await self.user_repo.get_by_id(user_id)
         return user is not None
 
     async def get_user_by_email(self, email: str) -> User | None:
@@ -54,7 +55,8 @@ class UserService:
 
     async def get_user_by_id(self, user_id: uuid.UUID) -> User | None:
         """Retrieves a user from the database by their primary key (user_id)."""
-        return await self.user_repo.get_by_id(user_id)
+        with self.session.no_autoflush:
+            return await self.user_repo.get_by_id(user_id)
 
     async def create_user(
         self,
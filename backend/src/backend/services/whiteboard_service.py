@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 import time
 
@@ -6,7 +6,6 @@ from backend.models.whiteboard import Whiteboard
 from backend.models.dtos.whiteboard_dtos import (
     WhiteboardCreateRequest,
     WhiteboardUpdateRequest,
-    WhiteboardSearchRequest,
     WhiteboardResponse,
     NodeHierarchyUpdate,
     CreateChildNodeRequest,
@@ -14,7 +13,7 @@ from backend.models.dtos.whiteboard_dtos import (
     ValidateHierarchyRequest,
     HierarchyValidationResponse
 )
-from backend.repositories.whiteboard_repository import WhiteboardRepository
+from backend.repositories.whiteboard_repository import WhiteboardRepository, encode_whiteboard_cursor
 
 
 class WhiteboardService:
@@ -27,6 +26,19 @@ class WhiteboardService:
         self.session = session
         self.repo = whiteboard_repository
 
+    @staticmethod
+    def next_page_cursor(
+        last_whiteboard: Optional[Whiteboard],
+        page_size: int,
+        limit: int
+    ) -> Optional[str]:
+        """
+        Returns the cursor for the page ending at `last_whiteboard`, or None if this was the last page.
+        """
+        if last_whiteboard is None or page_size < limit:
+            return None
+        return encode_whiteboard_cursor(last_whiteboard)
+
     @staticmethod
     def sanitize_content(content: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -70,21 +82,32 @@ class WhiteboardService:
 
         return whiteboard_record
 
-    async def get_whiteboards_for_user(
+    async def get_whiteboards_page(
         self,
         user_id: str,
         notebook_id: Optional[str] = None,
+        query: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
-    ) -> List[Whiteboard]:
+        offset: int = 0,
+        fuzzy: bool = False,
+        cursor: Optional[str] = None,
+        include_content: bool = True
+    ) -> Tuple[List[Whiteboard], Optional[int]]:
         """
-        Retrieve whiteboards for a user with optional filtering.
+        Retrieve one page of whiteboards (optionally matching a title query)
+        and the total number of matches, which is only counted for the first
+        page (without a cursor). Listings that only show titles can
+        pass include_content=False to skip loading the board content.
         """
-        return await self.repo.list_by_user_id(
+        return await self.repo.list_with_total(
             user_id=user_id,
             notebook_id=notebook_id,
+            query=query,
             limit=limit,
-            offset=offset
+            offset=offset,
+            fuzzy=fuzzy,
+            cursor=cursor,
+            include_content=include_content
         )
 
     async def get_whiteboard_by_id(self, user_id: str, whiteboard_id: str) -> Optional[Whiteboard]:
@@ -175,23 +198,6 @@ class WhiteboardService:
 
         return success
 
-    async def search_whiteboards(
-        self,
-        user_id: str,
-        search_data: WhiteboardSearchRequest,
-        notebook_id: Optional[str] = None
-    ) -> List[Whiteboard]:
-        """
-        Search whiteboards with multiple filter criteria.
-        """
-        return await self.repo.search_whiteboards(
-            user_id=user_id,
-            notebook_id=notebook_id,
-            query=search_data.query,
-            limit=search_data.limit,
-            offset=search_data.offset
-        )
-
     async def get_whiteboard_statistics(
         self,
         user_id: str,
@@ -209,16 +215,19 @@ class WhiteboardService:
             'total': total_count
         }
 
-    def whiteboard_to_response(self, whiteboard: Whiteboard) -> WhiteboardResponse:
+    def whiteboard_to_response(self, whiteboard: Whiteboard, include_content: bool = True) -> WhiteboardResponse:
         """
         Convert a Whiteboard entity to WhiteboardResponse DTO.
+        Values come straight from the database, so the DTO is built with
+        model_construct to skip a redundant validation pass.
+        With include_content=False, content is None (it was not loaded).
         """
-        return WhiteboardResponse(
+        return WhiteboardResponse.model_construct(
             id=whiteboard.id,
             user_id=whiteboard.user_id,
             notebook_id=whiteboard.notebook_id,
             title=whiteboard.title,
-            content=whiteboard.content or {},
+            content=(whiteboard.content or {}) if include_content else None,
             thumbnail_url=whiteboard.thumbnail_url,
             created_at=whiteboard.created_at,
             updated_at=whiteboard.updated_at
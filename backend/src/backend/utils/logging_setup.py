@@ -0,0 +1,48 @@
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# Only the application's own loggers are routed and leveled here; third-party
+# libraries (apscheduler, httpx, ...) keep their defaults, so their per-job and
+# per-request INFO lines do not reach stdout.
+APP_LOGGER_NAME = "backend"
+
+
+def setup_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Routes the `backend` logger through a QueueHandler so log calls made on the
+    event loop only enqueue the record; a background QueueListener thread does
+    the actual write to stdout.
+    Returns the started listener, which should be stopped on shutdown.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s:  %(name)s: %(message)s"))
+
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    app_logger.setLevel(level)
+    app_logger.addHandler(QueueHandler(log_queue))
+    # Records are written by the listener; don't also hand them to root's handlers
+    app_logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(listener: QueueListener) -> None:
+    """
+    Detaches the QueueHandler installed by setup_queue_logging from the
+    `backend` logger, then stops the listener, which writes out any records
+    still queued.
+    Without this, every restart of the app (tests, reload) would add another
+    handler and each log line would be written several times.
+    """
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    for handler in list(app_logger.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            app_logger.removeHandler(handler)
+    app_logger.propagate = True
+    listener.stop()
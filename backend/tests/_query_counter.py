@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(bind: Any) -> Iterator[List[str]]:
+    """
+    Records every SQL statement sent through `bind` while the block runs.
+    Accepts a sync or async Engine/Connection; async ones are unwrapped to
+    their sync counterparts, which is where cursor events fire.
+
+    Usage:
+        async with session_factory() as session:
+            with count_queries(session.bind) as queries:
+                await NotebookModelRepository(session).list_by_notebook_id(notebook_id)
+            assert len(queries) == 1
+    """
+    target = getattr(bind, "sync_engine", None) or getattr(bind, "sync_connection", None) or bind
+    queries: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,92 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_ai_service, get_file_service
+from backend.api.routes import files_route
+from backend.api.routes.auth_route import get_current_user
+from backend.services import ai_service
+from backend.services.ai_service import AIService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    created = []
+
+    async def create_stateless_run(payload):
+        created.append(payload)
+        return {"run_id": "run"}
+
+    monkeypatch.setattr(ai_service, "create_stateless_run", create_stateless_run)
+    monkeypatch.setattr(ai_service, "_background_runs", set())
+
+    service = AIService(session=None, model_api_service=None, notebook_model_service=None, assistant_service=None)
+    monkeypatch.setattr(service, "_get_light_notebook_model",
+                        lambda notebook_id, user_id: _resolved(SimpleNamespace(model=SimpleNamespace(name="light"))))
+    monkeypatch.setattr(service, "_get_api_key", lambda user_id: _resolved("key"))
+    monkeypatch.setattr(service, "get_assistant_id", lambda graph_id: _resolved("assistant"))
+    service.created = created
+    return service
+
+
+async def _resolved(value):
+    return value
+
+
+def _dispatch(service):
+    return service._dispatch("file_name", "notebook", "user", run_input={}, metadata={})
+
+
+def test_dispatch_starts_the_run_in_the_background(service):
+    async def scenario():
+        assert await _dispatch(service) == {"status": "started"}
+        assert len(ai_service._background_runs) == 1
+        await asyncio.gather(*ai_service._background_runs)
+
+    asyncio.run(scenario())
+
+    assert [payload["assistant_id"] for payload in service.created] == ["assistant"]
+    assert ai_service._background_runs == set()
+
+
+def test_dispatch_is_refused_when_too_many_runs_are_starting(service, monkeypatch):
+    monkeypatch.setattr(ai_service, "MAX_BACKGROUND_RUNS", 2)
+
+    async def scenario():
+        await _dispatch(service)
+        await _dispatch(service)
+        with pytest.raises(ai_service.AIRunsBusyError, match="Too many AI runs"):
+            await _dispatch(service)
+        await asyncio.gather(*ai_service._background_runs)
+        # Room again once the held runs are created
+        await _dispatch(service)
+        await asyncio.gather(*ai_service._background_runs)
+
+    asyncio.run(scenario())
+
+    assert len(service.created) == 3
+
+
+def test_busy_dispatch_is_answered_with_503_and_retry_after():
+    class BusyAIService:
+        async def rewrite_content(self, **kwargs):
+            raise ai_service.AIRunsBusyError(in_flight=1000)
+
+    async def get_by_id_and_user(file_id, user_id):
+        return SimpleNamespace(content="some content")
+
+    app = FastAPI()
+    app.include_router(files_route.router, prefix="/files")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(user_id="user")
+    app.dependency_overrides[get_ai_service] = BusyAIService
+    app.dependency_overrides[get_file_service] = lambda: SimpleNamespace(
+        repo=SimpleNamespace(get_by_id_and_user=get_by_id_and_user)
+    )
+
+    response = TestClient(app).post("/files/rewrite/notebook", json={"file_id": "file"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(ai_service.RUNS_BUSY_RETRY_AFTER)
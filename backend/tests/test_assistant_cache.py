@@ -0,0 +1,34 @@
+import uuid
+
+import pytest
+
+from backend.models.assistant import Assistant
+from backend.repositories import assistant_repository
+from backend.repositories.assistant_repository import get_cached_assistant, get_cached_assistant_id
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(assistant_repository.time, "monotonic", lambda: now[0])
+    yield now
+    assistant_repository.evict_cached_assistant()
+
+
+def test_cached_assistant_is_served_within_the_ttl(clock):
+    assistant = Assistant(assistant_id=uuid.uuid4(), graph_id="chat_agent")
+    assistant_repository._cache_assistant(assistant)
+
+    clock[0] += assistant_repository.ASSISTANT_CACHE_TTL - 1
+
+    assert get_cached_assistant("chat_agent") is assistant
+    assert get_cached_assistant_id("chat_agent") == str(assistant.assistant_id)
+
+
+def test_expired_assistant_is_evicted(clock):
+    assistant_repository._cache_assistant(Assistant(assistant_id=uuid.uuid4(), graph_id="chat_agent"))
+
+    clock[0] += assistant_repository.ASSISTANT_CACHE_TTL
+
+    assert get_cached_assistant_id("chat_agent") is None
+    assert "chat_agent" not in assistant_repository._assistants_by_graph_id
@@ -0,0 +1,39 @@
+import pytest
+from cryptography.fernet import Fernet
+
+from backend.services import fernet_service
+from backend.services.fernet_service import FernetService
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(fernet_service.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(fernet_service, "_decrypted", {})
+    return now
+
+
+def test_expired_plaintexts_are_evicted(clock):
+    service = FernetService(Fernet(Fernet.generate_key()))
+    first = service.encrypt_data("first-key")
+    second = service.encrypt_data("second-key")
+
+    assert service.decrypt_data(first) == "first-key"
+    clock[0] += fernet_service.DECRYPTED_CACHE_TTL_SECONDS / 2
+    assert service.decrypt_data(second) == "second-key"
+
+    # Only the first plaintext has outlived the TTL
+    clock[0] += fernet_service.DECRYPTED_CACHE_TTL_SECONDS / 2
+    assert service.decrypt_data(second) == "second-key"
+    assert list(fernet_service._decrypted) == [second]
+
+
+def test_full_cache_drops_only_the_oldest_plaintext(clock, monkeypatch):
+    monkeypatch.setattr(fernet_service, "DECRYPTED_CACHE_MAX_SIZE", 2)
+    service = FernetService(Fernet(Fernet.generate_key()))
+    tokens = [service.encrypt_data(f"key-{i}") for i in range(3)]
+
+    for token in tokens:
+        service.decrypt_data(token)
+
+    assert list(fernet_service._decrypted) == tokens[1:]
@@ -0,0 +1,174 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend.services import langgraph_client
+from backend.services.langgraph_client import create_stateless_run
+
+
+class StubRuns:
+    """Records runs.create / runs.create_batch calls and answers with one run per payload."""
+
+    def __init__(self, error: Exception = None, drop_last: bool = False):
+        self.create_calls = []
+        self.batch_calls = []
+        self.error = error
+        self.drop_last = drop_last
+        # Inputs the server answers with 422, failing any batch that contains them
+        self.rejected_inputs = set()
+
+    def _reject(self, path: str) -> httpx.HTTPStatusError:
+        request = httpx.Request("POST", f"http://langgraph{path}")
+        response = httpx.Response(422, request=request)
+        return httpx.HTTPStatusError("Unprocessable Entity", request=request, response=response)
+
+    async def create(self, thread_id, **payload):
+        self.create_calls.append((thread_id, payload))
+        if self.error:
+            raise self.error
+        if payload["input"] in self.rejected_inputs:
+            raise self._reject("/runs")
+        return {"run_id": payload["input"]}
+
+    async def create_batch(self, payloads):
+        self.batch_calls.append(payloads)
+        if self.error:
+            raise self.error
+        if any(payload["input"] in self.rejected_inputs for payload in payloads):
+            raise self._reject("/runs/batch")
+        runs = [{"run_id": payload["input"]} for payload in payloads]
+        return runs[:-1] if self.drop_last else runs
+
+
+class StubClient:
+    def __init__(self, runs: StubRuns):
+        self.runs = runs
+
+
+@pytest.fixture
+def stub_runs(monkeypatch):
+    runs = StubRuns()
+    monkeypatch.setattr(langgraph_client, "_client", StubClient(runs))
+    return runs
+
+
+def _payload(i: int) -> dict:
+    return {"assistant_id": "assistant", "input": f"run-{i}"}
+
+
+async def _submit(count: int) -> list:
+    return await asyncio.gather(*(create_stateless_run(_payload(i)) for i in range(count)), return_exceptions=True)
+
+
+def test_single_run_is_created_directly(stub_runs):
+    run = asyncio.run(create_stateless_run(_payload(0)))
+
+    assert run == {"run_id": "run-0"}
+    assert stub_runs.create_calls == [(None, _payload(0))]
+    assert stub_runs.batch_calls == []
+
+
+def test_runs_within_the_window_are_batched(stub_runs):
+    runs = asyncio.run(_submit(3))
+
+    assert runs == [{"run_id": f"run-{i}"} for i in range(3)]
+    assert stub_runs.batch_calls == [[_payload(i) for i in range(3)]]
+    assert stub_runs.create_calls == []
+
+
+def test_full_batch_is_sent_without_waiting_for_the_window(stub_runs, monkeypatch):
+    monkeypatch.setattr(langgraph_client, "RUN_BATCH_MAX_SIZE", 3)
+    monkeypatch.setattr(langgraph_client, "RUN_BATCH_WINDOW_SECONDS", 60)
+
+    async def scenario():
+        # Would time out if the batch waited for the 60s window
+        runs = await asyncio.wait_for(_submit(3), timeout=1)
+        assert langgraph_client._batch_flush is None
+        return runs
+
+    runs = asyncio.run(scenario())
+
+    assert runs == [{"run_id": f"run-{i}"} for i in range(3)]
+    assert stub_runs.batch_calls == [[_payload(i) for i in range(3)]]
+
+
+def test_runs_over_the_size_cap_go_into_the_next_batch(stub_runs, monkeypatch):
+    monkeypatch.setattr(langgraph_client, "RUN_BATCH_MAX_SIZE", 3)
+
+    runs = asyncio.run(_submit(5))
+
+    assert runs == [{"run_id": f"run-{i}"} for i in range(5)]
+    assert stub_runs.batch_calls == [[_payload(i) for i in range(3)], [_payload(3), _payload(4)]]
+    assert stub_runs.create_calls == []
+
+
+def test_batch_failure_reaches_every_submitter_without_retry(stub_runs):
+    stub_runs.error = RuntimeError("server unavailable")
+
+    results = asyncio.run(_submit(3))
+
+    assert all(result is stub_runs.error for result in results)
+    assert len(stub_runs.batch_calls) == 1
+    assert stub_runs.create_calls == []
+
+
+def test_single_run_failure_is_raised(stub_runs):
+    stub_runs.error = RuntimeError("server unavailable")
+
+    with pytest.raises(RuntimeError, match="server unavailable"):
+        asyncio.run(create_stateless_run(_payload(0)))
+
+
+def test_submitters_without_a_returned_run_fail_instead_of_hanging(stub_runs):
+    stub_runs.drop_last = True
+
+    async def scenario():
+        return await asyncio.wait_for(_submit(3), timeout=1)
+
+    results = asyncio.run(scenario())
+
+    assert results[:2] == [{"run_id": "run-0"}, {"run_id": "run-1"}]
+    assert isinstance(results[2], RuntimeError)
+
+
+def test_rejected_batch_is_retried_run_by_run(stub_runs):
+    stub_runs.rejected_inputs = {"run-1"}
+
+    results = asyncio.run(_submit(3))
+
+    assert results[0] == {"run_id": "run-0"}
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    assert results[2] == {"run_id": "run-2"}
+    assert len(stub_runs.batch_calls) == 1
+    assert sorted(payload["input"] for _, payload in stub_runs.create_calls) == ["run-0", "run-1", "run-2"]
+
+
+def test_server_error_on_a_batch_is_not_retried(stub_runs):
+    request = httpx.Request("POST", "http://langgraph/runs/batch")
+    stub_runs.error = httpx.HTTPStatusError("Bad Gateway", request=request, response=httpx.Response(502, request=request))
+
+    results = asyncio.run(_submit(3))
+
+    assert all(result is stub_runs.error for result in results)
+    assert stub_runs.create_calls == []
+
+
+def test_drain_sends_pending_runs_and_waits_for_them(stub_runs, monkeypatch):
+    monkeypatch.setattr(langgraph_client, "RUN_BATCH_WINDOW_SECONDS", 60)
+
+    async def scenario():
+        submitted = [asyncio.create_task(create_stateless_run(_payload(i))) for i in range(2)]
+        # Let both submitters queue their payload behind the 60s window
+        await asyncio.sleep(0)
+        assert len(langgraph_client._pending_runs) == 2
+
+        await langgraph_client.drain_stateless_runs()
+
+        assert langgraph_client._batch_flush is None
+        assert len(stub_runs.batch_calls) == 1
+        return await asyncio.wait_for(asyncio.gather(*submitted), timeout=1)
+
+    runs = asyncio.run(scenario())
+
+    assert runs == [{"run_id": "run-0"}, {"run_id": "run-1"}]
@@ -0,0 +1,95 @@
+import asyncio
+import uuid
+
+import pytest
+
+from backend.repositories.notebook_repository import NotebookRepository
+from backend.services import notebook_touches
+from backend.services.notebook_touches import flush_notebook_touches, mark_notebook_touched
+
+
+class StubSession:
+    def __init__(self):
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture(autouse=True)
+def pending_touches(monkeypatch):
+    touches = set()
+    monkeypatch.setattr(notebook_touches, "_pending_touches", touches)
+    return touches
+
+
+def test_flush_writes_and_clears_pending_touches(pending_touches, monkeypatch):
+    written = []
+
+    async def touch_many(self, notebook_ids):
+        written.append(set(notebook_ids))
+
+    monkeypatch.setattr(NotebookRepository, "touch_many", touch_many)
+    notebook_ids = {uuid.uuid4(), uuid.uuid4()}
+    for notebook_id in notebook_ids:
+        mark_notebook_touched(notebook_id)
+    session = StubSession()
+
+    assert asyncio.run(flush_notebook_touches(lambda: session)) == 2
+    assert written == [{str(notebook_id) for notebook_id in notebook_ids}]
+    assert session.committed
+    assert pending_touches == set()
+
+
+def test_failed_flush_keeps_touches(pending_touches, monkeypatch):
+    async def touch_many(self, notebook_ids):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(NotebookRepository, "touch_many", touch_many)
+    notebook_id = uuid.uuid4()
+    mark_notebook_touched(notebook_id)
+
+    assert asyncio.run(flush_notebook_touches(lambda: StubSession())) == 0
+    assert pending_touches == {str(notebook_id)}
+
+
+def test_cancelled_flush_keeps_touches(pending_touches, monkeypatch):
+    writing = asyncio.Event()
+
+    async def touch_many(self, notebook_ids):
+        writing.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(NotebookRepository, "touch_many", touch_many)
+    notebook_id = uuid.uuid4()
+    touched_during_flush = uuid.uuid4()
+    mark_notebook_touched(notebook_id)
+
+    async def scenario():
+        flush = asyncio.create_task(flush_notebook_touches(lambda: StubSession()))
+        await writing.wait()
+        # Touches marked while the write is in flight must survive as well
+        mark_notebook_touched(touched_during_flush)
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+    asyncio.run(scenario())
+
+    assert pending_touches == {str(notebook_id), str(touched_during_flush)}
+
+
+def test_invalid_notebook_ids_are_not_recorded(pending_touches):
+    notebook_id = uuid.uuid4()
+
+    mark_notebook_touched("not-a-uuid")
+    mark_notebook_touched(None)
+    mark_notebook_touched(str(notebook_id).upper())
+
+    assert pending_touches == {str(notebook_id)}
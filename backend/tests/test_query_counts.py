@@ -0,0 +1,85 @@
+import asyncio
+import uuid
+
+import pytest
+
+from backend.models.chat import Chat
+from backend.models.generative_model import GenerativeModel
+from backend.models.notebook import Notebook
+from backend.models.notebook_model import NotebookModel
+from backend.models.thread import Thread
+from backend.repositories.notebook_model_repository import NotebookModelRepository
+from backend.repositories.notebook_repository import NotebookRepository
+from tests._query_counter import count_queries
+
+USER_ID = "user-1"
+
+
+async def _create_notebook(session_factory, thread_count: int = 0, model_types=()) -> uuid.UUID:
+    """Creates a notebook with `thread_count` chats (one thread each) and one notebook model per type."""
+    async with session_factory() as session:
+        notebook = Notebook(id=uuid.uuid4(), user_id=USER_ID, title="Notebook")
+        session.add(notebook)
+        for i in range(thread_count):
+            thread = Thread(thread_id=uuid.uuid4())
+            session.add(thread)
+            session.add(Chat(user_id=USER_ID, title=f"Chat {i}", notebook_id=notebook.id, thread_id=thread.thread_id))
+        for model_type in model_types:
+            model = GenerativeModel(id=uuid.uuid4(), name=f"{model_type}-model", type=model_type)
+            session.add(model)
+            session.add(NotebookModel(user_id=USER_ID, notebook_id=notebook.id, generative_model_id=model.id))
+        await session.commit()
+        return notebook.id
+
+
+@pytest.mark.parametrize("thread_count", [1, 5])
+def test_get_by_id_with_threads_runs_two_queries(session_factory, thread_count):
+    async def scenario():
+        notebook_id = await _create_notebook(session_factory, thread_count=thread_count)
+        # A chat of another notebook must not show up
+        await _create_notebook(session_factory, thread_count=1)
+
+        async with session_factory() as session:
+            with count_queries(session.bind) as queries:
+                notebook = await NotebookRepository(session).get_by_id_with_threads(notebook_id)
+                assert len(notebook.threads) == thread_count
+            assert len(queries) == 2
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("model_count", [1, 5])
+def test_list_by_notebook_id_is_bounded(session_factory, model_count):
+    async def scenario():
+        notebook_id = await _create_notebook(session_factory, model_types=[f"type-{i}" for i in range(model_count)])
+
+        async with session_factory() as session:
+            repo = NotebookModelRepository(session)
+
+            with count_queries(session.bind) as queries:
+                notebook_models = await repo.list_by_notebook_id(notebook_id)
+            assert len(notebook_models) == model_count
+            assert len(queries) == 1
+
+            with count_queries(session.bind) as queries:
+                notebook_models = await repo.list_by_notebook_id(notebook_id, include_model=True)
+                assert all(notebook_model.model.type.startswith("type-") for notebook_model in notebook_models)
+            assert len(queries) == 2
+
+    asyncio.run(scenario())
+
+
+def test_get_by_notebook_id_and_types_runs_one_query(session_factory):
+    async def scenario():
+        notebook_id = await _create_notebook(session_factory, model_types=["light", "heavy", "other"])
+
+        async with session_factory() as session:
+            with count_queries(session.bind) as queries:
+                by_type = await NotebookModelRepository(session).get_by_notebook_id_and_types(notebook_id, ["light", "heavy"])
+                assert {model_type: notebook_model.model.type for model_type, notebook_model in by_type.items()} == {
+                    "light": "light",
+                    "heavy": "heavy",
+                }
+            assert len(queries) == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,209 @@
+import asyncio
+import base64
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_task_service
+from backend.api.routes import tasks_route
+from backend.api.routes.auth_route import get_current_user
+from backend.models.notebook import Notebook
+from backend.models.task import Task, TaskStatus
+from backend.repositories.task_repository import TaskRepository, decode_task_cursor, encode_task_cursor
+from backend.services.task_service import TaskService
+
+USER_ID = "user-1"
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+T1 = T0 + timedelta(hours=1)
+T2 = T0 + timedelta(hours=2)
+
+
+def _encode(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+MALFORMED_CURSORS = [
+    "not a cursor",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    _encode({"status": "todo"}),
+    _encode(["todo", 0, T0.isoformat()]),
+    _encode(["todo", "first", T0.isoformat(), str(uuid.uuid4())]),
+    _encode(["todo", 0, "yesterday", str(uuid.uuid4())]),
+    _encode(["todo", 0, T0.isoformat(), "not-a-uuid"]),
+    _encode(["todo", None, T0.isoformat(), str(uuid.uuid4())]),
+    _encode(42),
+]
+
+
+def test_cursor_round_trips():
+    task = Task(status=TaskStatus.TODO.value, position=3, created_at=T1, id=uuid.uuid4())
+
+    assert decode_task_cursor(encode_task_cursor(task)) == ("todo", 3, T1, task.id)
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_task_cursor(cursor)
+
+
+@pytest.fixture
+def client():
+    # The cursor is decoded before the repository touches the session, so none is needed
+    app = FastAPI()
+    app.include_router(tasks_route.router, prefix="/tasks")
+    app.dependency_overrides[get_current_user] = lambda: type("CurrentUser", (), {"user_id": USER_ID})()
+    app.dependency_overrides[get_task_service] = lambda: TaskService(session=None, task_repository=TaskRepository(None))
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_listing_with_malformed_cursor_returns_400(client, cursor):
+    response = client.get(f"/tasks/{uuid.uuid4()}", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_search_with_malformed_cursor_returns_400(client, cursor):
+    response = client.post(f"/tasks/{uuid.uuid4()}/search", json={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+async def _create_tasks(session_factory) -> list:
+    """
+    Creates tasks with ties on status and position, and on created_at within
+    those, plus an archived task; returns the listed ones in their expected order.
+    """
+    rows = [
+        ("todo", 0, T1), ("todo", 0, T1), ("todo", 0, T1), ("todo", 0, T0),
+        ("todo", 1, T1), ("todo", 1, T1),
+        ("done", 0, T2), ("done", 0, T1),
+        ("in-progress", 0, T1),
+    ]
+    async with session_factory() as session:
+        notebook = Notebook(id=uuid.uuid4(), user_id=USER_ID, title="Notebook")
+        session.add(notebook)
+        await session.flush()
+        tasks = [
+            Task(id=uuid.uuid4(), user_id=USER_ID, notebook_id=notebook.id, title=f"Task {i}",
+                 status=status, position=position, created_at=created_at)
+            for i, (status, position, created_at) in enumerate(rows)
+        ]
+        session.add_all(tasks)
+        session.add(Task(id=uuid.uuid4(), user_id=USER_ID, notebook_id=notebook.id, title="Archived",
+                         status="todo", position=0, created_at=T1, archived=True))
+        await session.commit()
+
+    tasks.sort(key=lambda task: (task.status, task.position, -task.created_at.timestamp(), task.id))
+    return tasks
+
+
+async def _page_through(list_page, limit: int, max_pages: int = 20) -> list:
+    """
+    Follows next-page cursors the way the routes hand them out, collecting every task id.
+    Gives up after max_pages, so a cursor that does not advance fails instead of looping.
+    """
+    ids, cursor = [], None
+    for _ in range(max_pages):
+        page = await list_page(limit, cursor)
+        ids.extend(task.id for task in page)
+        cursor = TaskService.next_page_cursor(page[-1] if page else None, len(page), limit)
+        if cursor is None:
+            return ids
+    pytest.fail(f"Paging did not finish within {max_pages} pages")
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4])
+def test_listing_pages_cover_every_task_once(session_factory, limit):
+    async def scenario():
+        expected = await _create_tasks(session_factory)
+
+        async with session_factory() as session:
+            repo = TaskRepository(session)
+
+            async def list_page(page_limit, cursor):
+                return await repo.list_by_user_id(USER_ID, limit=page_limit, cursor=cursor)
+
+            assert await _page_through(list_page, limit) == [task.id for task in expected]
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4])
+def test_search_pages_cover_every_task_once(session_factory, limit):
+    async def scenario():
+        expected = await _create_tasks(session_factory)
+
+        async with session_factory() as session:
+            repo = TaskRepository(session)
+
+            async def list_page(page_limit, cursor):
+                return [task async for task in repo.search_tasks(USER_ID, query="Task", limit=page_limit, cursor=cursor)]
+
+            assert await _page_through(list_page, limit) == [task.id for task in expected]
+
+    asyncio.run(scenario())
+
+
+def test_tasks_without_created_at_get_one_and_are_paged(session_factory):
+    async def scenario():
+        expected = await _create_tasks(session_factory)
+
+        async with session_factory() as session:
+            # A NULL created_at would sort first and be skipped by every seek
+            with pytest.raises(IntegrityError):
+                await session.execute(
+                    text("UPDATE tasks SET created_at = NULL WHERE id = :id"), {"id": expected[0].id}
+                )
+            await session.rollback()
+
+            # Created without a timestamp, the row takes the server default
+            unstamped = Task(id=uuid.uuid4(), user_id=USER_ID, notebook_id=expected[0].notebook_id,
+                             title="Task unstamped", status="todo", position=0)
+            session.add(unstamped)
+            await session.commit()
+            await session.refresh(unstamped)
+            assert unstamped.created_at is not None
+
+            repo = TaskRepository(session)
+
+            async def list_page(page_limit, cursor):
+                return await repo.list_by_user_id(USER_ID, limit=page_limit, cursor=cursor)
+
+            expected.append(unstamped)
+            expected.sort(key=lambda task: (task.status, task.position, -task.created_at.timestamp(), task.id))
+            assert await _page_through(list_page, 2) == [task.id for task in expected]
+
+    asyncio.run(scenario())
+
+
+def test_cross_notebook_listing_with_malformed_cursor_returns_400(client):
+    response = client.get("/tasks", params={"cursor": "not a cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("path", ["/tasks", f"/tasks/{uuid.uuid4()}"])
+def test_listing_with_offset_returns_400(client, path):
+    response = client.get(path, params={"offset": 100})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == tasks_route.OFFSET_NOT_SUPPORTED
+
+
+def test_search_with_offset_returns_400(client):
+    response = client.post(f"/tasks/{uuid.uuid4()}/search", json={"offset": 100})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == tasks_route.OFFSET_NOT_SUPPORTED
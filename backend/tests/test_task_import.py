@@ -0,0 +1,79 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_task_service
+from backend.api.routes import tasks_route
+from backend.api.routes.auth_route import get_current_user
+from backend.models.notebook import Notebook
+from backend.models.task import TaskStatus
+from backend.services.task_service import TaskService
+
+USER_ID = "user-1"
+NOTEBOOK_ID = str(uuid.uuid4())
+IMPORT = {"tasks": [{"title": "First"}, {"title": "Second"}]}
+
+
+class StubSession:
+    def __init__(self, notebook):
+        self.notebook = notebook
+
+    async def get(self, model, ident):
+        return self.notebook
+
+    async def commit(self):
+        pass
+
+
+class StubTaskRepository:
+    def __init__(self):
+        self.copied = None
+
+    async def get_status_counts(self, user_id, notebook_id):
+        return {status: 0 for status in TaskStatus}
+
+    async def bulk_create_tasks(self, rows):
+        self.copied = rows
+        return [uuid.uuid4() for _ in rows]
+
+
+def _client(notebook, repo):
+    service = TaskService(session=StubSession(notebook), task_repository=repo)
+    app = FastAPI()
+    app.include_router(tasks_route.router, prefix="/tasks")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(user_id=USER_ID)
+    app.dependency_overrides[get_task_service] = lambda: service
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("notebook", [None, Notebook(user_id="someone-else")])
+def test_import_into_a_notebook_the_user_does_not_own_returns_404(notebook):
+    repo = StubTaskRepository()
+
+    response = _client(notebook, repo).post(f"/tasks/{NOTEBOOK_ID}/import", json=IMPORT)
+
+    assert response.status_code == 404
+    assert repo.copied is None
+
+
+def test_import_with_malformed_notebook_id_returns_404():
+    repo = StubTaskRepository()
+
+    response = _client(Notebook(user_id=USER_ID), repo).post("/tasks/not-a-uuid/import", json=IMPORT)
+
+    assert response.status_code == 404
+    assert repo.copied is None
+
+
+def test_import_into_own_notebook_copies_the_tasks():
+    repo = StubTaskRepository()
+
+    response = _client(Notebook(user_id=USER_ID), repo).post(f"/tasks/{NOTEBOOK_ID}/import", json=IMPORT)
+
+    assert response.status_code == 200
+    assert len(response.json()["task_ids"]) == 2
+    assert [row["title"] for row in repo.copied] == ["First", "Second"]
+    assert [row["position"] for row in repo.copied] == [0, 1]
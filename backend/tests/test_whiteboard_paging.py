@@ -0,0 +1,77 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_whiteboard_service
+from backend.api.routes import whiteboards_route
+from backend.api.routes.auth_route import get_current_user
+from backend.models.whiteboard import Whiteboard
+from backend.repositories.whiteboard_repository import WhiteboardRepository, encode_whiteboard_cursor
+from backend.services.whiteboard_service import WhiteboardService
+
+USER_ID = "user-1"
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+CURSOR = encode_whiteboard_cursor(Whiteboard(id=uuid.uuid4(), updated_at=T0))
+
+
+class StubWhiteboardRepository(WhiteboardRepository):
+    """Answers every listing with a full page, so a next cursor would be due."""
+
+    def __init__(self):
+        super().__init__(None)
+
+    async def list_with_total(self, user_id, notebook_id=None, query=None, limit=100, offset=0,
+                              fuzzy=False, cursor=None, include_content=True):
+        if cursor and offset:
+            # Delegate to the real check, which raises before any query is built
+            return await super().list_with_total(user_id, notebook_id, query, limit, offset, fuzzy, cursor)
+        whiteboards = [
+            Whiteboard(id=uuid.uuid4(), user_id=user_id, notebook_id=uuid.UUID(notebook_id), title=f"Board {i}",
+                       content={}, created_at=T0, updated_at=T0 - timedelta(minutes=offset + i))
+            for i in range(limit)
+        ]
+        return whiteboards, None if cursor else 1000
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(whiteboards_route.router, prefix="/whiteboards")
+    app.dependency_overrides[get_current_user] = lambda: type("CurrentUser", (), {"user_id": USER_ID})()
+    app.dependency_overrides[get_whiteboard_service] = lambda: WhiteboardService(
+        session=None, whiteboard_repository=StubWhiteboardRepository()
+    )
+    return TestClient(app)
+
+
+def test_listing_rejects_cursor_with_offset(client):
+    response = client.get(f"/whiteboards/{uuid.uuid4()}", params={"cursor": CURSOR, "offset": 10})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cursor pagination cannot be combined with offset"
+
+
+def test_search_rejects_cursor_with_offset(client):
+    response = client.post(f"/whiteboards/{uuid.uuid4()}/search", json={"cursor": CURSOR, "offset": 10})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cursor pagination cannot be combined with offset"
+
+
+@pytest.mark.parametrize("offset, has_next_cursor", [(0, True), (10, False)])
+def test_listing_hands_out_cursors_only_without_offset(client, offset, has_next_cursor):
+    response = client.get(f"/whiteboards/{uuid.uuid4()}", params={"limit": 2, "offset": offset})
+
+    assert response.status_code == 200
+    assert (response.json()["next_cursor"] is not None) == has_next_cursor
+
+
+@pytest.mark.parametrize("offset, has_next_cursor", [(0, True), (10, False)])
+def test_search_hands_out_cursors_only_without_offset(client, offset, has_next_cursor):
+    response = client.post(f"/whiteboards/{uuid.uuid4()}/search", json={"limit": 2, "offset": offset})
+
+    assert response.status_code == 200
+    assert (response.json()["next_cursor"] is not None) == has_next_cursor
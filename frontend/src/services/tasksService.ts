@@ -74,7 +74,7 @@ export interface TaskSearchRequest {
     has_due_date?: boolean;
     is_overdue?: boolean;
     limit?: number;
-    offset?: number;
+    cursor?: string; // next_cursor from the previous page
 }
 
 /**
@@ -120,6 +120,7 @@ export interface TaskOperationResponse {
 export interface TasksListResponse {
     tasks: TaskResponse[];
     total_count: number;
+    next_cursor?: string | null; // Pass back as `cursor` to fetch the next page
     status: string;
     message: string;
 }
@@ -193,7 +194,7 @@ export const TasksService = {
             priority?: TaskPriority;
             tags?: string[];
             limit?: number;
-            offset?: number;
+            cursor?: string;
             includeArchived?: boolean;
         }
     ): Promise<TasksListResponse> {
@@ -203,7 +204,7 @@ export const TasksService = {
         if (filters?.priority) params.append('priority', filters.priority);
         if (filters?.tags?.length) params.append('tags', filters.tags.join(','));
         if (filters?.limit) params.append('limit', filters.limit.toString());
-        if (filters?.offset) params.append('offset', filters.offset.toString());
+        if (filters?.cursor) params.append('cursor', filters.cursor);
         if (filters?.includeArchived) params.append('include_archived', 'true');
 
         const url = params.toString() ? `${API_BASE_URL}/${notebookId}?${params}` : `${API_BASE_URL}/${notebookId}`;
@@ -223,10 +224,10 @@ export const TasksService = {
             tags?: string[];
             notebookId?: string;
             limit?: number;
-            offset?: number;
+            cursor?: string;
             includeArchived?: boolean;
         }
-    ): Promise<{tasks: TaskWithNotebook[], total_count: number, status: string, message: string}> {
+    ): Promise<{tasks: TaskWithNotebook[], total_count: number, next_cursor?: string | null, status: string, message: string}> {
         const params = new URLSearchParams();
 
         if (filters?.status) params.append('status', filters.status);
@@ -234,7 +235,7 @@ export const TasksService = {
         if (filters?.tags?.length) params.append('tags', filters.tags.join(','));
         if (filters?.notebookId) params.append('notebook_id', filters.notebookId);
         if (filters?.limit) params.append('limit', filters.limit.toString());
-        if (filters?.offset) params.append('offset', filters.offset.toString());
+        if (filters?.cursor) params.append('cursor', filters.cursor);
         if (filters?.includeArchived) params.append('include_archived', 'true');
 
         const url = params.toString() ? `${API_BASE_URL}?${params}` : API_BASE_URL;